@@ -1,8 +1,10 @@
-from typing import Dict
+from typing import Dict, Iterable, Iterator, Callable
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 
-from idataframe.itypes.BaseIType import BaseIType
+from idataframe.itypes.BaseIType import BaseIType, concat_columns, copy_frame
 
 __all__ = ['DataFrame']
 
@@ -20,17 +22,28 @@ class DataFrame(object):
             raise TypeError("Input data must be a Pandas DataFrame object" +
                             " (now input type is {})".format(type(dataframe)))
 
-        self._df = pd.DataFrame({})
+        self._df = None           # cached `df`, with the versions of the ITypes it was built from
+        self._df_versions = None
         self._df_original = dataframe
         self._cols = {}  # dict of all the IType objects
+        self._arrow_strings = False
 
     @property
     def df(self) -> pd.DataFrame:
-        dataframe = pd.DataFrame({})
-        for name in self._cols:
-            dataframe[name] = self._cols[name].series
-
-        return dataframe
+        """
+        The (parsed) values of all registered columns, built in one
+        concatenation without copying the data. It is kept until a column is
+        registered or (re)parsed; every access returns a copy of it, so changing
+        the result doesn't change the cache.
+        """
+        versions = [(name, self._cols[name]._version) for name in self._cols]
+        if self._df is None or self._df_versions != versions:
+            if len(self._cols) == 0:
+                self._df = pd.DataFrame({})
+            else:
+                self._df = concat_columns([self._cols[name].series for name in self._cols], list(self._cols))
+            self._df_versions = versions
+        return copy_frame(self._df)
 
     @df.setter
     def df(self, _):
@@ -51,9 +64,64 @@ class DataFrame(object):
                 raise TypeError("The type of '{}' is not a valid IType".format(series_type))
 
             self._cols[series_name] = series_type(self._df_original[series_name])
-
-    def parse_all(self, *args, **kwargs):
+            if self._arrow_strings:
+                self._cols[series_name].use_arrow_strings()
+
+    def use_arrow_strings(self, enabled:bool=True):
+        """
+        Arrow backed string columns for all registered (and later registered)
+        ITypes; see `BaseIType.use_arrow_strings`.
+        """
+        self._arrow_strings = enabled
+        for col in self._cols:
+            self._cols[col].use_arrow_strings(enabled)
+
+    def parse_all(self, *args, n_jobs:int=None, **kwargs):
+        if n_jobs is not None and n_jobs < 0:
+            n_jobs = os.cpu_count()
+        if n_jobs is not None and n_jobs > 1:   # one pool of processes for all columns
+            with ProcessPoolExecutor(n_jobs) as pool:
+                self._parse_all(*args, n_jobs=n_jobs, pool=pool, **kwargs)
+        else:
+            self._parse_all(*args, **kwargs)
+
+    def _parse_all(self, *args, **kwargs):
         for col in self._cols:
             print(80*'-'+'\n\n'+'parsing \'{}\''.format(col))
             self._cols[col].parse(*args, **kwargs)
-        print(80*'-'+'\n')
\ No newline at end of file
+        print(80*'-'+'\n')
+
+    def parse_stream(self, reader:Iterable[pd.DataFrame], sink:Callable[[pd.DataFrame], None]=None,
+                           n_jobs:int=None, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Streaming counterpart of `parse_all`: parses the registered columns of
+        every chunk of `reader` (e.g. `pd.read_csv(..., chunksize=N)`) and yields
+        per chunk a DataFrame like the `df` property, or passes it to `sink` if
+        given. Chunks are not kept; see `stream_stats` and `stream_messages` of
+        the registered ITypes for the statistics and messages of all chunks.
+        Categorical columns are encoded per chunk (see `BaseIType.parse_iter`).
+        """
+        chunks = self._parse_stream(reader, n_jobs, **kwargs)
+        if sink is None:
+            return chunks
+        for chunk in chunks:
+            sink(chunk)
+
+    def _parse_stream(self, reader:Iterable[pd.DataFrame], n_jobs:int=None,
+                            max_messages:int=BaseIType.MAX_NR_ERROR_MESSAGES, seed:int=None,
+                            **kwargs) -> Iterator[pd.DataFrame]:
+        if n_jobs is not None and n_jobs < 0:
+            n_jobs = os.cpu_count()
+        pool = ProcessPoolExecutor(n_jobs) if n_jobs is not None and n_jobs > 1 else None
+        try:
+            for col in self._cols:
+                self._cols[col]._reset_stream(max_messages, seed)
+            for chunk in reader:
+                dataframe = pd.DataFrame({}, index=chunk.index)
+                for col in self._cols:
+                    parsed = self._cols[col]._parse_stream_chunk(chunk[col], n_jobs=n_jobs, pool=pool, **kwargs)
+                    dataframe[col] = parsed[self._cols[col]._series_name]
+                yield dataframe
+        finally:
+            if pool is not None:
+                pool.shutdown()
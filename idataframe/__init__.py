@@ -1,16 +1,43 @@
+import importlib
+
 from idataframe import tools
+from idataframe.DataFrame import DataFrame   # eager: the submodule has the same name and would shadow the class
+
+__all__ = ['tools', 'Email', 'Label', 'AddressTokenizer', 'StreetAddressUS', 'Text', 'Grade', 'Rank', 'Count',
+           'Amount', 'Balance', 'ParseCache', 'DataFrame']
+
+# the ITypes are imported on first use (PEP 562 module `__getattr__`), so a process that
+# only parses doesn't import modules it never uses
+_LAZY_ATTRIBUTES = {
+    'Email': 'idataframe.itypes.nominal_discrete.Email',
+    'Label': 'idataframe.itypes.nominal_discrete.Label',
+    'AddressTokenizer': 'idataframe.itypes.nominal_discrete.StreetAddress',
+    'StreetAddressUS': 'idataframe.itypes.nominal_discrete.StreetAddress',
+    'Text': 'idataframe.itypes.nominal_discrete.Text',
+
+    'Grade': 'idataframe.itypes.ordinal_discrete.Grade',
+    'Rank': 'idataframe.itypes.ordinal_discrete.Rank',
+
+    'Count': 'idataframe.itypes.interval_discrete.Count',
+
+    'Amount': 'idataframe.itypes.ratio_continuous.Amount',
+    'Balance': 'idataframe.itypes.ratio_continuous.Balance',
 
-from idataframe.itypes.nominal_discrete.Email import *
-from idataframe.itypes.nominal_discrete.Label import *
-from idataframe.itypes.nominal_discrete.StreetAddress import *
-from idataframe.itypes.nominal_discrete.Text import *
+    'ParseCache': 'idataframe.itypes.ParseCache',
+}
+_SUBPACKAGES = ('continuities', 'distributions', 'fields', 'itypes', 'scales')
 
-from idataframe.itypes.ordinal_discrete.Grade import *
-from idataframe.itypes.ordinal_discrete.Rank import *
 
-from idataframe.itypes.interval_discrete.Count import *
+def __getattr__(name:str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module('{}.{}'.format(__name__, name))
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value   # next lookups don't call `__getattr__`
+    return value
 
-from idataframe.itypes.ratio_continuous.Amount import *
-from idataframe.itypes.ratio_continuous.Balance import *
 
-from idataframe.DataFrame import DataFrame
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
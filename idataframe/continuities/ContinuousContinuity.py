@@ -1,5 +1,4 @@
 from idataframe.continuities.BaseContinuity import BaseContinuity
-from idataframe.distributions.ContinuousDistribution import ContinuousDistribution
 
 __all__ = ['ContinuousContinuity']
 
@@ -13,6 +12,9 @@ class ContinuousContinuity(BaseContinuity):
         super().__init__()
 
     def fitDistribution(self, *args, **kwargs):
+        # imported on first use: it imports plotnine and SciPy
+        from idataframe.distributions.ContinuousDistribution import ContinuousDistribution
+
         series = self.series  # uses BaseType class
         distr = ContinuousDistribution.from_pandas_series(series, *args, **kwargs)
         return distr
@@ -1,11 +1,50 @@
 import abc
 
+import numpy as np
+import pandas as pd
+
+from idataframe.tools import LRUCache
+
 __all__ = ['BaseField']
 
 
+def _identity(value):
+    return value   # module level (not a lambda), so fields with the default post-parse function can be pickled
+
+
 class BaseField(abc.ABC):
-    def __init__(self, post_parse_fn=None):
-        self.post_parse_fn = post_parse_fn if callable(post_parse_fn) else lambda value: value
+    PURE_FN_CACHE = LRUCache()   # shared by the pure post-parse functions of all fields in the process
+
+    def __init__(self, post_parse_fn=None, post_parse_series_fn=None, pure:bool=False):
+        """
+        `post_parse_fn` normalizes a parsed string value. `post_parse_series_fn`
+        is its vectorized form (Series -> Series, e.g. `lambda values:
+        values.str.lower()`), used by the vectorized parse engine; missing
+        results count as failures there. If only the vectorized form is
+        given, it is also used value by value.
+
+        With `pure` (the result only depends on the value) the results of
+        `post_parse_fn` are memoized in `PURE_FN_CACHE`.
+        """
+        self.post_parse_series_fn = post_parse_series_fn if callable(post_parse_series_fn) else None
+        if callable(post_parse_fn):
+            self.post_parse_fn = post_parse_fn
+        elif self.post_parse_series_fn is not None:
+            self.post_parse_fn = self._value_fn(self.post_parse_series_fn)
+        else:
+            self.post_parse_fn = _identity
+            pure = False
+        if pure:
+            self.post_parse_fn = self.PURE_FN_CACHE.memoize(self.post_parse_fn)
+
+    @staticmethod
+    def _value_fn(post_parse_series_fn):
+        def post_parse_fn(value):
+            value = post_parse_series_fn(pd.Series([value], dtype=object)).iloc[0]
+            if pd.isna(value):
+                raise ValueError("Value can't be post-parsed")
+            return value
+        return post_parse_fn
 
     @property
     @abc.abstractmethod
@@ -14,4 +53,39 @@ class BaseField(abc.ABC):
 
     @abc.abstractmethod
     def str_to_type_fn(self, value:str):
-        pass
\ No newline at end of file
+        pass
+
+    def to_series(self, strings:pd.Series) -> pd.Series:
+        """
+        Whole-column counterpart of `str_to_type_fn`, used by the vectorized
+        parse engine. Values that can't be converted are missing; the engine
+        converts missing values again with `str_to_type_fn` (to tell a failure
+        apart from e.g. a NaN). Override it with a vectorized conversion.
+        """
+        values = np.full(strings.shape[0], None, dtype=object)
+        for i, value in enumerate(strings):
+            try:
+                values[i] = self.str_to_type_fn(value)
+            except:
+                pass
+        return pd.Series(values, index=strings.index, dtype=object)
+
+    @staticmethod
+    def _to_floats(strings:pd.Series) -> np.ndarray:
+        # NumPy converts every value with Python's `float` (`pd.to_numeric` isn't correctly rounded)
+        values = strings.to_numpy(dtype=object)
+        try:
+            return values.astype(np.float64)
+        except (TypeError, ValueError, OverflowError):
+            floats = np.full(len(values), np.nan)
+            for i, value in enumerate(values):
+                try:
+                    floats[i] = float(value)
+                except:
+                    pass
+            return floats
+
+    @staticmethod
+    def _to_ints(floats:np.ndarray, index:pd.Index) -> pd.Series:
+        is_int = np.isfinite(floats) & (np.abs(floats) < 2.0**63)
+        return pd.Series(pd.arrays.IntegerArray(np.where(is_int, floats, 0).astype(np.int64), ~is_int), index=index)
@@ -0,0 +1,12 @@
+from idataframe.fields.StrField import StrField
+
+__all__ = ['CategoryField']
+
+
+class CategoryField(StrField):
+    """
+    Text with few different values, stored as a Pandas categorical column: the
+    parsed strings are dictionary encoded (see `BaseIType._result_columns`), so
+    e.g. `value_counts` and `groupby` work on small integer codes.
+    """
+    series_type = 'category'   # Pandas Series type
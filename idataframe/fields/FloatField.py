@@ -1,3 +1,5 @@
+import pandas as pd
+
 from idataframe.fields.BaseField import BaseField
 
 __all__ = ['FloatField']
@@ -6,8 +8,11 @@ __all__ = ['FloatField']
 class FloatField(BaseField):
     series_type = 'Float64'    # Pandas Series type; don't use `float` as type because then it can't contain NaN values
 
-    def __init__(self, parse_fn=None):
-        super().__init__(parse_fn)
+    def __init__(self, parse_fn=None, parse_series_fn=None, pure:bool=False):
+        super().__init__(parse_fn, parse_series_fn, pure)
 
     def str_to_type_fn(self, value):
         return float(value)
+
+    def to_series(self, strings):
+        return pd.Series(self._to_floats(strings), index=strings.index)
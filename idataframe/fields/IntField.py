@@ -1,3 +1,5 @@
+import numpy as np
+
 from idataframe.fields.BaseField import BaseField
 
 __all__ = ['IntField']
@@ -6,8 +8,11 @@ __all__ = ['IntField']
 class IntField(BaseField):
     series_type = 'Int64'    # Pandas Series type; don't use `int` as type because then it can't contain NaN values
 
-    def __init__(self, parse_fn=None):
-        super().__init__(parse_fn)
+    def __init__(self, parse_fn=None, parse_series_fn=None, pure:bool=False):
+        super().__init__(parse_fn, parse_series_fn, pure)
 
     def str_to_type_fn(self, value):
-        return int(round(float(value), 0))
\ No newline at end of file
+        return int(round(float(value), 0))
+
+    def to_series(self, strings):
+        return self._to_ints(np.round(self._to_floats(strings)), strings.index)
@@ -8,8 +8,11 @@ __all__ = ['IntFloorField']
 class IntFloorField(BaseField):
     series_type = 'Int64'    # Pandas Series type; don't use `int` as type because then it can't contain NaN values
 
-    def __init__(self, parse_fn=None):
-        super().__init__(parse_fn)
+    def __init__(self, parse_fn=None, parse_series_fn=None, pure:bool=False):
+        super().__init__(parse_fn, parse_series_fn, pure)
 
     def str_to_type_fn(self, value):
-        return int(np.floor(float(value)))
\ No newline at end of file
+        return int(np.floor(float(value)))
+
+    def to_series(self, strings):
+        return self._to_ints(np.floor(self._to_floats(strings)), strings.index)
@@ -6,8 +6,11 @@ __all__ = ['StrField']
 class StrField(BaseField):
     series_type = 'str'   # Pandas Series type
 
-    def __init__(self, parse_fn=None):
-        super().__init__(parse_fn)
+    def __init__(self, parse_fn=None, parse_series_fn=None, pure:bool=False):
+        super().__init__(parse_fn, parse_series_fn, pure)
 
     def str_to_type_fn(self, value):
-        return value
\ No newline at end of file
+        return value
+
+    def to_series(self, strings):
+        return strings
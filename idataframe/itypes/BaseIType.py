@@ -1,10 +1,25 @@
-from typing import Tuple, Callable, List
-import re
+from typing import Tuple, Callable, List, Dict, Iterable, Iterator, Union
+import os
+import signal
+import threading
+import pickle
+import json
+import hashlib
+import inspect
+import types
+import time
+import contextlib
+from statistics import NormalDist
+from concurrent.futures import Executor, ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 
-from idataframe.tools import Value, Message, list_remove_duplicates
+from idataframe.tools import Value, Message, Reservoir, list_remove_duplicates
 from idataframe.fields.BaseField import BaseField
+from idataframe.itypes.Match import Prefilter, PrefilterFeatures, Match, FusedMatch
+from idataframe.itypes.ParseResult import ParseResult
+from idataframe.itypes.ParseCache import ParseCache
+from idataframe.itypes.ParseProfile import ParseProfile
 
 __all__ = ['BaseIType']
 
@@ -12,6 +27,107 @@ __all__ = ['BaseIType']
 # -----------------------------------------------------------------------------
 
 
+def _parse_chunk(itype_state:tuple, originals:pd.Series, engine:str, fused:bool, reorder:bool,
+                 time_budget:float=None) -> ParseResult:
+    """
+    Worker side of a multi-process parse: rebuilds the IType from its class and
+    constructor arguments and parses one chunk of original values.
+    """
+    itype = BaseIType._from_state(itype_state, originals)
+    parse_fn = itype._parse_vectorized if engine == 'vectorized' else itype._parse_rows
+    return parse_fn(originals, fused, reorder, time_budget)
+
+
+class _ParseTimeout(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def _time_limit(seconds:float):
+    """
+    Raises `_ParseTimeout` inside the block once it runs longer than `seconds`.
+    A real time interval timer (SIGALRM) is used: the regular expression engine
+    checks for signals while matching, so a runaway match is interrupted too.
+    """
+    def raise_timeout(signum, frame):
+        raise _ParseTimeout()
+
+    previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _check_time_budget(time_budget:float):
+    if time_budget is None:
+        return
+    if not time_budget > 0:
+        raise ValueError("`time_budget` must be a positive number of seconds (now time_budget is {!r})".format(
+                         time_budget))
+    if not hasattr(signal, 'setitimer'):
+        raise ValueError("A time budget needs interval timers (SIGALRM), which this platform doesn't have")
+    if threading.current_thread() is not threading.main_thread():
+        raise ValueError("A time budget can only be used when parsing in the main thread")
+
+
+def _fn_identity(fn:Callable) -> str:
+    """
+    Identity of a function that is stable between runs: qualified name and a
+    hash of the byte code (closure variables are not taken into account).
+    """
+    func = inspect.unwrap(fn)   # unwrap profiled and memoized functions
+    func = getattr(func, '__func__', func)
+    name = '{}.{}'.format(getattr(func, '__module__', None), getattr(func, '__qualname__', type(func).__qualname__))
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return name
+    consts = [const for const in code.co_consts if not isinstance(const, types.CodeType)]
+    return '{}:{}'.format(name, hashlib.sha256(code.co_code + repr(consts).encode()).hexdigest())
+
+
+def concat_columns(columns:List[pd.Series], names:List[str]) -> pd.DataFrame:
+    """
+    DataFrame of the columns (with the same index) in one concatenation. The
+    data of the columns is not copied: pandas 3 copies lazily (copy-on-write),
+    older versions are asked not to copy.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        return pd.concat(columns, axis=1, keys=names, copy=False)
+    return pd.concat(columns, axis=1, keys=names)
+
+
+def copy_frame(df:Union[pd.DataFrame, pd.Series]) -> Union[pd.DataFrame, pd.Series]:
+    """
+    Copy of a cached DataFrame (or Series), so changing it doesn't change the
+    cache. With copy-on-write (pandas 3) the data is only copied when it's
+    changed, older versions copy it at once.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        return df.copy()
+    return df.copy(deep=False)
+
+
+def _arrow_string_dtype() -> pd.StringDtype:
+    """
+    Arrow backed string type with NaN as missing value (like a column of
+    Python strings, so the string values of missing values stay 'nan').
+    """
+    try:
+        import pyarrow   # noqa: F401
+    except ImportError:
+        raise ImportError("Arrow backed strings need the pyarrow package (pip install pyarrow)")
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)   # pandas >= 2.3
+    except TypeError:
+        return pd.StringDtype('pyarrow_numpy')
+
+
+# -----------------------------------------------------------------------------
+
+
 class BaseIType(object):
     """
     Base type as foundation of all data types.
@@ -19,6 +135,20 @@ class BaseIType(object):
 
     MAX_NR_ERROR_MESSAGES = 20
     COLUMN_NAME_ORIGINAL = '__original__'
+    PARSE_ENGINES = ('row', 'vectorized')
+    ERROR_CODES = ('no match', 'timeout')
+    NR_CHUNKS_PER_JOB = 4   # default chunk size: every process parses this number of chunks
+    TIME_BUDGET_BLOCK_SIZE = 256   # number of values matched at once with a time budget
+    STR_SERIES_TYPES = ('str', 'string', str)
+
+    def __new__(cls, *args, **kwargs):
+        # keep the constructor arguments without the series, so the IType can be rebuilt in a worker process
+        obj = super().__new__(cls)
+        kwargs = dict(kwargs)
+        if kwargs.pop('series', None) is None:
+            args = args[1:]
+        obj._init_args = (args, kwargs)
+        return obj
 
     def __init__(self, series:pd.Series, fields:Tuple[Tuple[str, BaseField]]):
         if not type(series) == type(pd.Series([])):
@@ -34,22 +164,44 @@ class BaseIType(object):
             if not isinstance(field, tuple) or not len(field) == 2 or not isinstance(field[0], str) or not isinstance(field[1], BaseField):
                 raise SyntaxError('Configuration syntax is invalid, it should be (name <str>, series_type <SeriesType>). Now it\'s: {}'.format(field))
 
-        self._df = pd.DataFrame({
-            self.COLUMN_NAME_ORIGINAL : series
-        })
+        self._original = series   # reference to the source column, not a copy
+        self._columns = {}          # parsed value column and field columns
+        self._df = None             # `df` is assembled when asked for
+        self._version = 0           # increased on every change of the columns
 
         self._series_name = fields[0][0]
         self._series_type = fields[0][1].series_type
         self._series_str_to_type_fn = fields[0][1].str_to_type_fn
+        self._series_to_series_fn = fields[0][1].to_series
         self._series_post_parse_fn = fields[0][1].post_parse_fn
+        self._series_post_parse_series_fn = fields[0][1].post_parse_series_fn
         self._fields_fields = fields[1:] if len(fields) > 1 else []
         self._pre_parse_fns = []
+        self._pre_parse_series_fns = []   # vectorized forms of the pre-parse functions (or None)
         self._matches = []
         self._matches_str = []
+        self._fused_matches = {}
+        self._disjoint_matches = None
+        self._match_order = None
+        self._hit_counts = None
+        self._cache_stats = {'hits': 0, 'misses': 0}
+        self._parsed_hashes = None   # row hashes of the parsed values, computed by the first `update`
+        self._parsed_match_ids = None
+        self._profile = None
+        self._string_dtype = None
+        self._numeric_regexps = None   # matches parsed by the numeric fast path (see `_parse_numeric`)
+        self._errors = None
+        self._failure_counts = None
+        self._error_samples = []
+        self._stream_stats = None
+        self._stream_reservoir = Reservoir(0)
 
     @property
     def df(self) -> pd.DataFrame:
-        return self._df
+        if self._df is None:
+            self._df = concat_columns([self._original, *self._columns.values()],
+                                      [self.COLUMN_NAME_ORIGINAL, *self._columns])
+        return copy_frame(self._df)
 
     @df.setter
     def df(self, _):
@@ -57,33 +209,178 @@ class BaseIType(object):
 
     @property
     def is_parsed(self) -> bool:
-        return self._series_name in self._df
+        return self._series_name in self._columns
 
     @is_parsed.setter
     def is_parsed(self, _):
         raise PermissionError("The is_parsed property is read only")
 
+    @property
+    def errors(self) -> pd.DataFrame:
+        """
+        Error table of the last parse: position and error code of every value
+        that can't be parsed.
+        """
+        return self._errors
+
+    @errors.setter
+    def errors(self, _):
+        raise PermissionError("The errors property is read only")
+
+    @property
+    def failure_counts(self) -> Dict[str, int]:
+        if self._failure_counts is None:
+            return None
+        return {match.name: int(count) for match, count in zip(self._matches, self._failure_counts)}
+
+    @failure_counts.setter
+    def failure_counts(self, _):
+        raise PermissionError("The failure_counts property is read only")
+
+    @property
+    def hit_counts(self) -> Dict[str, int]:
+        """
+        Number of values parsed by every match in the last parse (or warm-up,
+        see `learn_match_order`).
+        """
+        if self._hit_counts is None:
+            return None
+        return {match.name: int(count) for match, count in zip(self._matches, self._hit_counts)}
+
+    @hit_counts.setter
+    def hit_counts(self, _):
+        raise PermissionError("The hit_counts property is read only")
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Number of distinct values read from (hits) and not found in (misses)
+        the parse cache, counted over all parses with a cache.
+        """
+        return dict(self._cache_stats)
+
+    @cache_stats.setter
+    def cache_stats(self, _):
+        raise PermissionError("The cache_stats property is read only")
+
+    @property
+    def memo_stats(self) -> Dict[str, int]:
+        """
+        Hits, misses, evictions and size of the in-memory cache of pure
+        post-parse functions (`BaseField.PURE_FN_CACHE`), which is shared by
+        all ITypes in the process.
+        """
+        return BaseField.PURE_FN_CACHE.stats
+
+    @memo_stats.setter
+    def memo_stats(self, _):
+        raise PermissionError("The memo_stats property is read only")
+
+    @property
+    def profile(self) -> pd.DataFrame:
+        """
+        Profile of the last parse with `profile=True`: per stage (string
+        conversion, pre-parse function, prefilter, match, field and value post-parse
+        and type conversion, write-back) the number of calls, hits and seconds.
+        """
+        return self._profile
+
+    @profile.setter
+    def profile(self, _):
+        raise PermissionError("The profile property is read only")
+
+    @property
+    def match_order(self) -> List[str]:
+        """
+        Names of the matches in the order they are tried when parsing with
+        `reorder=True`. It can be persisted and restored with `set_match_order`.
+        """
+        return [self._matches[match_id].name for match_id in self._attempt_order(True)]
+
+    @match_order.setter
+    def match_order(self, _):
+        raise PermissionError("The match_order property is read only, use `set_match_order`")
+
+    @property
+    def error_samples(self) -> List[Value]:
+        return self._error_samples
+
+    @error_samples.setter
+    def error_samples(self, _):
+        raise PermissionError("The error_samples property is read only")
+
     @property
     def series(self) -> pd.Series:
         if not self.is_parsed:
-            return self._df[self.COLUMN_NAME_ORIGINAL]
+            return self._original.rename(self.COLUMN_NAME_ORIGINAL)
         else:
-            return self._df[self._series_name]
+            return copy_frame(self._columns[self._series_name])
 
     @series.setter
     def series(self, _):
         raise PermissionError("The series property is read only")
 
-    def add_pre_parse_fn(self, pre_parse_fn:Callable[[str], str]):
+    def use_arrow_strings(self, enabled:bool=True):
+        """
+        Stores the original values (if they are strings) and the parsed values
+        of string fields as Arrow backed strings instead of Python objects (needs
+        pyarrow). The parse engines write the Arrow arrays at once.
+        """
+        self._string_dtype = _arrow_string_dtype() if enabled else None
+        self._original = self._original_column(self._original)
+        if enabled:
+            for column_name, column_type in self._column_types():
+                if column_name in self._columns and column_type in self.STR_SERIES_TYPES:
+                    self._columns[column_name] = self._columns[column_name].astype(self._string_dtype)
+        self._set_columns(self._original, self._columns)
+
+    def _set_columns(self, original:pd.Series, columns:Dict[str, pd.Series]):
+        self._original = original
+        self._columns = columns
+        self._df = None
+        self._version = self._version + 1
+
+    def _original_column(self, series:pd.Series) -> pd.Series:
+        if self._string_dtype is None or series.dtype == self._string_dtype:
+            return series
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            return series   # numbers and other objects are kept as they are
+        if series.dtype != object and not pd.api.types.is_string_dtype(series.dtype):
+            return series
+        return series.astype(self._string_dtype)
+
+    def _column_types(self) -> List[Tuple[str, object]]:
+        return [(self._series_name, self._series_type),
+                *[(field_name, field.series_type) for field_name, field in self._fields_fields]]
+
+    def add_pre_parse_fn(self, pre_parse_fn:Callable[[str], str],
+                               pre_parse_series_fn:Callable[[pd.Series], pd.Series]=None):
+        """
+        Registers a function that normalizes every value before matching, and
+        optionally its vectorized form (Series -> Series, e.g. with
+        `Series.str.replace`) for the vectorized parse engine. Both must give
+        the same results. If only the vectorized form is given (`pre_parse_fn`
+        is None), it is also used value by value.
+        """
+        if pre_parse_fn is None and callable(pre_parse_series_fn):
+            pre_parse_fn = lambda value: pre_parse_series_fn(pd.Series([value], dtype=object)).iloc[0]
         if not callable(pre_parse_fn):
             raise TypeError("`pre_parse_fn` must be callable (now type is {})".format(type(pre_parse_fn)))
+        if pre_parse_series_fn is not None and not callable(pre_parse_series_fn):
+            raise TypeError("`pre_parse_series_fn` must be callable (now type is {})".format(type(pre_parse_series_fn)))
 
         self._pre_parse_fns.append(pre_parse_fn)
+        self._pre_parse_series_fns.append(pre_parse_series_fn)
 
     def reset_matches(self):
         self._matches_str = []
 
-    def add_match(self, name:str, regexp:str, str_format:str):
+    def add_match(self, name:str, regexp:str, str_format:str, prefilter:Prefilter=None):
+        """
+        Registers a match. Values that can't match are skipped without running
+        the regular expression if they are rejected by the prefilter: by default
+        derived from `regexp`, `False` for no prefilter.
+        """
         if not isinstance(name, str):
             raise TypeError("`name` attribute must be a string (now name type is {})".format(type(name)))
 
@@ -93,89 +390,797 @@ class BaseIType(object):
         if not isinstance(str_format, str):
             raise TypeError("`str_format` attribute must be a string (now str_format type is {})".format(type(str_format)))
 
-        def fn_match(value:str) -> Value:
-            m = re.search(regexp, value)
-            if m is not None:
-                field_str_values = {}
-                field_values = {}
-                for field_fields in self._fields_fields:
-                    field_name = field_fields[0]
-                    field_str_to_type_fn = field_fields[1].str_to_type_fn
-                    field_post_parse_fn = field_fields[1].post_parse_fn
-                    try:
-                        field_str_values[field_name] = field_post_parse_fn(m.group(field_name))
-                        field_values[field_name] = field_str_to_type_fn(field_str_values[field_name])
-                    except:
-                        field_str_values[field_name] = ''
-                try:
-                    field_str_values[self._series_name] = self._series_post_parse_fn(m.group(self._series_name))
-                except:
-                    pass
-                value = self._series_str_to_type_fn(self._series_post_parse_fn(str_format.format(**field_str_values)))
-                return_value = (value, field_values)
-                return Value(return_value)
-            else:
-                return Message('value can\'t be parsed: {}'.format(value))
+        if prefilter is not None and prefilter is not False and not isinstance(prefilter, Prefilter):
+            raise TypeError("`prefilter` attribute must be a Prefilter (now prefilter type is {})".format(type(prefilter)))
 
+        match = Match(len(self._matches), name, regexp, str_format, prefilter)   # compiles the regular expression once
         self._matches_str.append('match {:>2} :: {:<24} :: {}'.format(str(len(self._matches) + 1), name, regexp))
-        self._matches.append((name, fn_match))
+        self._matches.append(match)
+        self._fused_matches = {}
+        self._disjoint_matches = None
+        self._match_order = None
+        self._hit_counts = None
 
-    def _parse_str_value(self, original_value:str) -> Value:
-        parsed_value = None
-        messages = []
-        for match_name, fn in self._matches:
-            value_obj = fn(original_value).prefix_messages('match {:<30} :: '.format(match_name))
-            match_value = value_obj.value
-            match_messages = value_obj.messages
-            if match_value is not None:
-                parsed_value = match_value
-                messages = []
-                break
-            else:
-                messages = messages + match_messages
-        return Value(parsed_value, None, messages)
+    def _attempt_order(self, reorder:bool=False) -> List[int]:
+        if not reorder or self._match_order is None:
+            return list(range(len(self._matches)))
+        return self._match_order
 
-    def parse(self, max_values:int=None, max_messages:int=MAX_NR_ERROR_MESSAGES, verbose=True) -> List[Value]:
-        value_list = []
-        nr_messages = 0
-        self._df[self._series_name] = np.nan
-        self._df[self._series_name] = self._df[self._series_name].astype(self._series_type)
+    def _match_segments(self, fused:bool=False, reorder:bool=False) -> list:
+        """
+        The registered matches in order of registration (or in the learned
+        order with `reorder`); with `fused`, runs of anchored matches are joined
+        into one `FusedMatch`.
+        """
+        matches = [self._matches[match_id] for match_id in self._attempt_order(reorder)]
+        if not fused:
+            return matches
+        key = tuple(match.match_id for match in matches)
+        if key not in self._fused_matches:
+            self._fused_matches[key] = FusedMatch.fuse(matches)
+        return self._fused_matches[key]
 
+    def _is_disjoint(self, match_id:int, other_match_id:int) -> bool:
+        if self._disjoint_matches is None:
+            nr_matches = len(self._matches)
+            self._disjoint_matches = np.zeros((nr_matches, nr_matches), dtype=bool)
+            for i in range(nr_matches):
+                for j in range(i + 1, nr_matches):
+                    is_disjoint = self._matches[i].is_disjoint(self._matches[j])
+                    self._disjoint_matches[i, j] = is_disjoint
+                    self._disjoint_matches[j, i] = is_disjoint
+        return bool(self._disjoint_matches[match_id, other_match_id])
+
+    def _safe_order(self, hit_counts:np.ndarray) -> List[int]:
+        """
+        Orders the matches by number of hits (most hits first). A match is only
+        tried before a match registered earlier if both are proven disjoint, so
+        the first match that succeeds is the same as in the registration order.
+        A match that has to be tried before a frequent match gets its priority.
+        """
+        nr_matches = len(self._matches)
+        priorities = list(hit_counts)
+        for i in reversed(range(nr_matches)):
+            for j in range(i + 1, nr_matches):
+                if not self._is_disjoint(i, j):
+                    priorities[i] = max(priorities[i], priorities[j])
+
+        remaining = list(range(nr_matches))
+        order = []
+        while len(remaining) > 0:
+            available = [j for j in remaining
+                         if all(i not in remaining or self._is_disjoint(i, j) for i in range(j))]
+            best = max(available, key=lambda match_id: (priorities[match_id], hit_counts[match_id], -match_id))
+            order.append(best)
+            remaining.remove(best)
+        return order
+
+    def _sample_originals(self, nr_samples:int, seed:int=None) -> pd.Series:
+        """
+        Uniform random sample (without replacement) of the original values, in
+        the order of the column.
+        """
+        originals = self._original
+        if nr_samples >= originals.shape[0]:
+            return originals
+        positions = np.sort(np.random.default_rng(seed).choice(originals.shape[0], nr_samples, replace=False))
+        return originals.iloc[positions]
+
+    def learn_match_order(self, nr_samples:int=None, seed:int=None, engine:str='vectorized') -> List[str]:
+        """
+        Learns the order in which the matches are tried with `reorder=True` from
+        the hit counts of the last parse, or of a warm-up parse of a random
+        sample of `nr_samples` original values. Returns the `match_order`.
+        """
+        if nr_samples is not None:
+            originals = self._sample_originals(nr_samples, seed)
+            self._hit_counts = self._result_hit_counts(self._parse_originals(originals, engine))
+        if self._hit_counts is None:
+            raise ValueError("There are no hit counts to learn the match order from: parse first or use `nr_samples`")
+        self._match_order = self._safe_order(self._hit_counts)
+        return self.match_order
+
+    def set_match_order(self, match_order:List[str]):
+        """
+        Restores a (persisted) `match_order`. Matches may only change places if
+        they are proven disjoint.
+        """
+        names = [match.name for match in self._matches]
+        if sorted(match_order) != sorted(names) or len(set(names)) != len(names):
+            raise ValueError("`match_order` must contain every match name once (now it's {})".format(match_order))
+        order = [names.index(name) for name in match_order]
+        for position, j in enumerate(order):
+            for i in order[position + 1:]:
+                if i < j and not self._is_disjoint(i, j):
+                    raise ValueError("Match {!r} can't be tried before match {!r}: they can match the same values".format(
+                                     names[j], names[i]))
+        self._match_order = order
+
+    def _match_value(self, match:Match, groups:dict) -> tuple:
+        field_str_values = {}
+        field_values = {}
         for field_fields in self._fields_fields:
             field_name = field_fields[0]
-            field_type = field_fields[1].series_type
-            self._df[field_name] = np.nan
-            self._df[field_name] = self._df[field_name].astype(field_type)
-
-        for index, value in self._df[self.COLUMN_NAME_ORIGINAL].items():
-            if max_values is not None and isinstance(max_values, int) and index > max_values:
-                value_list.append(
-                        Message('\nreached maximum number of values, parsing proces aborted...\n\nusing matches:\n{}\n'.format('\n'.join(self._matches_str))))
-                break
-            if max_messages is not None and isinstance(max_messages, int) and nr_messages > max_messages:
-                value_list.append(
-                        Message('\nreached maximum number of messages, parsing proces aborted...\n\nusing matches:\n{}\n'.format('\n'.join(self._matches_str))))
-                break
+            field_str_to_type_fn = field_fields[1].str_to_type_fn
+            field_post_parse_fn = field_fields[1].post_parse_fn
+            try:
+                field_str_values[field_name] = field_post_parse_fn(groups[field_name])
+                field_values[field_name] = field_str_to_type_fn(field_str_values[field_name])
+            except:
+                field_str_values[field_name] = ''
+        try:
+            field_str_values[self._series_name] = self._series_post_parse_fn(groups[self._series_name])
+        except:
+            pass
+        value = self._series_str_to_type_fn(self._series_post_parse_fn(match.str_format.format(**field_str_values)))
+        return (value, field_values)
+
+    def _match_message(self, match:Match, value:str) -> str:
+        return 'match {:<30} :: value can\'t be parsed: {}'.format(match.name, value)
+
+    def _timeout_message(self, value:str) -> str:
+        return 'matches exceeded the time budget :: value can\'t be parsed: {}'.format(value)
+
+    def _parse_str_value(self, original_value:str, fused:bool=False, reorder:bool=False,
+                               time_budget:float=None) -> Value:
+        """
+        Tries the matches on the value. With a `time_budget` (seconds) the
+        search is interrupted once it takes longer, the value then fails with
+        match id `ParseResult.TIMEOUT`.
+        """
+        messages = []
+        found = None
+        try:
+            with _time_limit(time_budget) if time_budget is not None else contextlib.nullcontext():
+                for segment in self._match_segments(fused, reorder):
+                    found = segment.search(original_value)
+                    if found is not None:
+                        break
+                    messages = messages + [self._match_message(match, original_value) for match in segment.matches]
+        except _ParseTimeout:
+            return Value(None, {'match_id': ParseResult.TIMEOUT}, [self._timeout_message(original_value)])
+        if found is None:
+            return Value(None, None, messages)
+        match_id, groups = found
+        return Value(self._match_value(self._matches[match_id], groups), {'match_id': match_id})
+
+    @staticmethod
+    def _to_str(value) -> str:
+        return str(value).strip()
+
+    @staticmethod
+    def _to_str_series(series:pd.Series) -> pd.Series:
+        return series.astype(object).map(str).str.strip()
+
+    def _pre_parse_series(self, series:pd.Series) -> pd.Series:
+        """
+        Column-wise counterpart of the string conversion and pre-parse functions
+        applied per value in `_parse_rows`. Returns a Series with a positional index.
+        """
+        strings = self._to_str_series(series).astype(object)   # object dtype: Python `re`, not the Arrow engine
+        for pre_parse_fn, pre_parse_series_fn in zip(self._pre_parse_fns, self._pre_parse_series_fns):
+            strings = pre_parse_series_fn(strings) if pre_parse_series_fn is not None else strings.map(pre_parse_fn)
+        return strings.astype(object).reset_index(drop=True)
+
+    def _parse_groups(self, groups:pd.DataFrame, str_format:str) -> Tuple[list, Dict[str, list]]:
+        """
+        Column-wise counterpart of the `fn_match` closure: converts the extracted
+        groups of all matched values into parsed values and field values.
+        """
+        nr_values = groups.shape[0]
+        groups = groups.astype(object).where(groups.notna(), None)   # non participating group -> None, like `m.group`
+        field_str_values = {}
+        field_values = {}
+        for field_name, field in self._fields_fields:
+            str_values = np.full(nr_values, '', dtype=object)
+            values = np.full(nr_values, None, dtype=object)
+            if field_name in groups:
+                post_parsed, is_post_parsed = self._apply_column(field.post_parse_series_fn, field.post_parse_fn,
+                                                                 groups[field_name])
+                positions = np.flatnonzero(is_post_parsed)
+                converted, is_converted = self._apply_column(field.to_series, field.str_to_type_fn,
+                                                             pd.Series(post_parsed[positions], dtype=object))
+                positions = positions[is_converted]
+                values[positions] = converted[is_converted]
+                str_values[positions] = post_parsed[positions]
+            field_str_values[field_name] = str_values
+            field_values[field_name] = values
+
+        series_str_values = nr_values * [None]
+        is_series_str_value = nr_values * [False]
+        if self._series_name in groups:
+            series_str_values, is_series_str_value = self._apply_column(
+                    self._series_post_parse_series_fn, self._series_post_parse_fn, groups[self._series_name])
+
+        str_values = nr_values * [None]
+        for i in range(nr_values):
+            format_values = {field_name: str_values[i] for field_name, str_values in field_str_values.items()}
+            if is_series_str_value[i]:
+                format_values[self._series_name] = series_str_values[i]
+            str_values[i] = str_format.format(**format_values)
+        str_values, _ = self._apply_column(self._series_post_parse_series_fn, self._series_post_parse_fn,
+                                           pd.Series(str_values, dtype=object), raise_errors=True)
+        parsed_values, _ = self._apply_column(self._series_to_series_fn, self._series_str_to_type_fn,
+                                              pd.Series(str_values, dtype=object), raise_errors=True)
+        return parsed_values, field_values
+
+    @staticmethod
+    def _apply_column(series_fn:Callable[[pd.Series], pd.Series], value_fn:Callable[[str], object],
+                      strings:pd.Series, raise_errors:bool=False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Applies a field function (post-parse or type conversion) to a column of
+        strings at once with its vectorized form `series_fn`, if there is one.
+        Missing results (failures, but also e.g. NaN values) are computed again
+        one by one with `value_fn`, so the values and the failures are the same
+        as per value. Returns the values and whether they succeeded; with
+        `raise_errors` a failure is raised.
+        """
+        if series_fn is None:
+            values = np.full(strings.shape[0], None, dtype=object)
+            is_done = np.zeros(strings.shape[0], dtype=bool)
+        else:
+            values = series_fn(strings).to_numpy(dtype=object, na_value=None)
+            is_done = pd.notna(values)
+        for position in np.flatnonzero(~is_done):
+            try:
+                values[position] = value_fn(strings.iloc[position])
+                is_done[position] = True
+            except:
+                if raise_errors:
+                    raise
+        return values, is_done
+
+    def _result_columns(self, result:ParseResult, index:pd.Index) -> Dict[str, pd.Series]:
+        """
+        Builds the output columns (value column and field columns) out of the
+        buffers of parsed values, each column at once. The result fills the first
+        positions of `index`, missing values are skipped.
+        """
+        columns = {}
+        for column_name, column_type, values in [(self._series_name, self._series_type, result.values),
+                                                 *[(field_name, field.series_type, result.field_values[field_name])
+                                                   for field_name, field in self._fields_fields]]:
+            if column_type == 'category':
+                columns[column_name] = self._categorical_column(result, column_name, index)
+                continue
+            if self._string_dtype is not None and column_type in self.STR_SERIES_TYPES:
+                strings = np.full(len(index), None, dtype=object)
+                strings[:len(values)] = values
+                columns[column_name] = pd.Series(strings, index=index, dtype=self._string_dtype, name=column_name)
+                continue
+            column = pd.Series(np.nan, index=index, name=column_name).astype(column_type)
+            is_value = pd.notna(values)
+            if is_value.any():
+                column.iloc[np.flatnonzero(is_value)] = values[is_value]
+            columns[column_name] = column
+        return columns
 
-            value_str = str(value).strip()
+    def _categorical_column(self, result:ParseResult, column_name:str, index:pd.Index) -> pd.Series:
+        """
+        Dictionary encodes a column of parsed values (categories in sorted
+        order). A deduplicated result is encoded by its distinct values, whose
+        codes are taken per row.
+        """
+        def column_values(result:ParseResult) -> np.ndarray:
+            return result.values if column_name == self._series_name else result.field_values[column_name]
+
+        if result.distinct is None:
+            codes, categories = pd.factorize(column_values(result), sort=True)
+        else:
+            row_codes, distinct = result.distinct
+            codes, categories = pd.factorize(column_values(distinct), sort=True)
+            codes = codes[row_codes]
+        column_codes = np.full(len(index), -1, dtype=codes.dtype)
+        column_codes[:len(codes)] = codes
+        return pd.Series(pd.Categorical.from_codes(column_codes, categories=categories), index=index, name=column_name)
+
+    def _parse_rows(self, originals:pd.Series, fused:bool=False, reorder:bool=False,
+                          time_budget:float=None) -> ParseResult:
+        """
+        Parses value by value.
+        """
+        result = ParseResult.empty(originals.shape[0], [field_name for field_name, _ in self._fields_fields])
+        for position, value in enumerate(originals):
+            value_str = self._to_str(value)
             for pre_parse_fn in self._pre_parse_fns:
                 value_str = pre_parse_fn(value_str)
-            value = self._parse_str_value(value_str)
+            result.strings[position] = value_str
+            value = self._parse_str_value(value_str, fused, reorder, time_budget)
 
-            if len(value.messages) > 0:
-                nr_messages = nr_messages + len(value.messages)
-                value_list.append(value.prefix_messages('index {:>4} :: '.format(index)))
             parsed_output = value.value
-            if parsed_output is not None:
-                parsed_value, parsed_field_values = parsed_output
-                self._df.loc[index, self._series_name] = parsed_value
-                for field_name, field_value in parsed_field_values.items():
-                    if field_name not in self._df.columns:
-                        raise KeyError('The field name \'{}\' is not defined in field_names tuple')
-                    self._df.loc[index, field_name] = field_value
+            if value['match_id'] == ParseResult.TIMEOUT:
+                result.match_ids[position] = ParseResult.TIMEOUT
+            elif parsed_output is not None:
+                parsed_value, field_values = parsed_output
+                result.match_ids[position] = value['match_id']
+                result.values[position] = parsed_value
+                for field_name, field_value in field_values.items():
+                    if field_name not in result.field_values:
+                        raise KeyError('The field name \'{}\' is not defined in field_names tuple'.format(field_name))
+                    result.field_values[field_name][position] = field_value
+        return result
+
+    def _parse_vectorized(self, originals:pd.Series, fused:bool=False, reorder:bool=False,
+                                time_budget:float=None) -> ParseResult:
+        """
+        Parses the whole column at once: every registered match is run as one
+        `Series.str.extract` over the values that are still unmatched, in order of
+        registration. Values rejected by the prefilter of a match are skipped.
+        The result is the same as the row-by-row parse.
+
+        With a `time_budget` (seconds per value) a match is run on blocks of
+        `TIME_BUDGET_BLOCK_SIZE` values, which get the budget times the number
+        of values in the block (see `_extract_blocks`).
+        """
+        strings = self._pre_parse_series(originals)
+        result = ParseResult.empty(strings.shape[0], [field_name for field_name, _ in self._fields_fields])
+        result.strings[:] = strings.to_numpy(dtype=object)
+
+        features = PrefilterFeatures(strings)
+        unmatched = np.arange(strings.shape[0])
+        for segment in self._match_segments(fused, reorder):
+            if len(unmatched) == 0:
+                break
+            is_candidate = segment.candidates_mask(features)
+            if is_candidate is not None:
+                is_candidate = is_candidate[unmatched]
+            is_matched = np.zeros(len(unmatched), dtype=bool)
+            if time_budget is None:
+                extracted = segment.extract(strings.iloc[unmatched], is_candidate)
+            else:
+                extracted, is_timeout = self._extract_blocks(segment, strings.iloc[unmatched], is_candidate,
+                                                             time_budget)
+                result.match_ids[unmatched[is_timeout]] = ParseResult.TIMEOUT
+                is_matched = is_matched | is_timeout   # not tried by the next matches
+            for match_id, is_hit, groups in extracted:
+                hits = unmatched[is_hit]
+                values, field_values = self._parse_groups(groups, self._matches[match_id].str_format)
+                result.values[hits] = pd.Series(values, dtype=object).to_numpy()
+                for field_name, values in field_values.items():
+                    result.field_values[field_name][hits] = pd.Series(values, dtype=object).to_numpy()
+                result.match_ids[hits] = match_id
+                is_matched = is_matched | is_hit
+            unmatched = unmatched[~is_matched]
+        return result
+
+    def _extract_blocks(self, segment, strings:pd.Series, is_candidate:np.ndarray,
+                              time_budget:float) -> Tuple[List[Tuple[int, np.ndarray, pd.DataFrame]], np.ndarray]:
+        """
+        `segment.extract` on blocks of the candidates, each with the time budget
+        of its values. A block that takes longer is run value by value (see
+        `_search_values`) to find the values that exceed the budget, so a value
+        that never finishes stalls the parse for at most the budget of one block.
+        Returns the extracted items (one per match) and the boolean mask of the
+        values that exceeded the budget.
+        """
+        candidates = np.arange(strings.shape[0]) if is_candidate is None else np.flatnonzero(is_candidate)
+        is_timeout = np.zeros(strings.shape[0], dtype=bool)
+        hits = {}   # match id -> (is_hit, groups of the blocks)
+        for start in range(0, len(candidates), self.TIME_BUDGET_BLOCK_SIZE):
+            block = candidates[start:start + self.TIME_BUDGET_BLOCK_SIZE]
+            try:
+                with _time_limit(time_budget * len(block)):
+                    extracted = list(segment.extract(strings.iloc[block]))
+            except _ParseTimeout:
+                extracted, is_block_timeout = self._search_values(segment, strings.iloc[block], None, time_budget)
+                is_timeout[block[is_block_timeout]] = True
+            for match_id, is_block_hit, groups in extracted:
+                is_hit, match_groups = hits.setdefault(match_id, (np.zeros(strings.shape[0], dtype=bool), []))
+                is_hit[block[is_block_hit]] = True
+                match_groups.append(groups)
+        # the blocks are in order of position, so the rows of the groups are in the order of the hits
+        return [(match_id, is_hit, pd.concat(groups)) for match_id, (is_hit, groups) in hits.items()], is_timeout
+
+    def _search_values(self, segment, strings:pd.Series, is_candidate:np.ndarray,
+                             time_budget:float) -> Tuple[List[Tuple[int, np.ndarray, pd.DataFrame]], np.ndarray]:
+        """
+        Value by value counterpart of `segment.extract` with a time budget per
+        value: the extracted items and the boolean mask of the values that
+        exceeded the budget.
+        """
+        positions = np.arange(strings.shape[0]) if is_candidate is None else np.flatnonzero(is_candidate)
+        is_timeout = np.zeros(strings.shape[0], dtype=bool)
+        hits = {}   # match id -> (positions, groups)
+        for position in positions:
+            try:
+                with _time_limit(time_budget):
+                    found = segment.search(strings.iloc[position])
+            except _ParseTimeout:
+                is_timeout[position] = True
+                continue
+            if found is not None:
+                hit_positions, hit_groups = hits.setdefault(found[0], ([], []))
+                hit_positions.append(position)
+                hit_groups.append(found[1])
+
+        extracted = []
+        for match_id, (hit_positions, hit_groups) in hits.items():
+            is_hit = np.zeros(strings.shape[0], dtype=bool)
+            is_hit[hit_positions] = True
+            groups = pd.DataFrame(hit_groups, index=strings.index[hit_positions],
+                                  columns=list(self._matches[match_id].pattern.groupindex), dtype=object)
+            extracted.append((match_id, is_hit, groups.fillna(np.nan)))   # like `str.extract`: NaN for missing groups
+        return extracted, is_timeout
+
+    def _parse_originals(self, originals:pd.Series, engine:str, dedupe:bool=False, fused:bool=False,
+                               n_jobs:int=None, chunksize:int=None, pool:Executor=None,
+                               reorder:bool=False, cache:ParseCache=None, time_budget:float=None) -> ParseResult:
+        if dedupe:
+            if originals.dtype == object:   # equal python objects (1, 1.0, True) can have different string values
+                originals = originals.map(str)
+            codes, uniques = pd.factorize(originals, use_na_sentinel=False)
+            distinct = self._parse_originals(pd.Series(uniques, dtype=originals.dtype), engine, False,
+                                             fused, n_jobs, chunksize, pool, reorder, cache, time_budget)
+            result = distinct.take(codes)
+            result.nr_distinct_values = len(uniques)
+            result.distinct = (codes, distinct)
+            return result
+
+        result = self._parse_numeric(originals)
+        if result is not None:
+            return result
+
+        if cache is not None:
+            return self._parse_cached(originals, cache, lambda strings: self._parse_originals(
+                    strings, engine, False, fused, n_jobs, chunksize, pool, reorder, None, time_budget))
+
+        if n_jobs is not None and n_jobs < 0:
+            n_jobs = os.cpu_count()
+        if n_jobs is not None and n_jobs > 1:
+            return self._parse_chunks(originals, engine, fused, n_jobs, chunksize, pool, reorder, time_budget)
+
+        parse_fn = self._parse_vectorized if engine == 'vectorized' else self._parse_rows
+        return parse_fn(originals, fused, reorder, time_budget)
+
+    def _parse_numeric(self, originals:pd.Series) -> ParseResult:
+        """
+        Fast path of the numeric ITypes for a column of numbers (NumPy integer or
+        float type): the numbers are validated and converted with NumPy (see
+        `_parse_numbers`) instead of matching their string values, with the same
+        result. Returns None if the fast path can't be used: the matches were
+        changed, a pre-parse function was added or `_parse_numbers` can't parse
+        the numbers.
+        """
+        if (self._numeric_regexps is None or len(self._pre_parse_fns) > 0 or
+                [match.regexp for match in self._matches] != self._numeric_regexps or
+                not isinstance(originals.dtype, np.dtype) or originals.dtype.kind not in 'iuf'):
+            return None
+        numbers = originals.to_numpy()
+        parsed = self._parse_numbers(numbers)
+        if parsed is None:
+            return None
+        match_ids, values = parsed
+        strings = np.full(len(numbers), None, dtype=object)
+        is_failed = match_ids < 0
+        strings[is_failed] = [str(number) for number in numbers[is_failed].tolist()]   # for the error messages
+        return ParseResult(strings, match_ids, values, {})
+
+    def _parse_numbers(self, numbers:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Match id (`ParseResult.NO_MATCH` if the string value of the number
+        doesn't match) and parsed value (NaN if none) of every number, or None.
+        Overridden by the numeric ITypes, which set `_numeric_regexps` to the
+        matches it gives the result of.
+        """
+        return None
+
+    @staticmethod
+    def _is_exact_float(numbers:np.ndarray) -> bool:
+        # integers that are exactly converted by `float` (the numbers of an integer array can be larger)
+        return numbers.dtype.kind == 'f' or not ((numbers > 2**53) | (numbers < -2**53)).any()
+
+    @contextlib.contextmanager
+    def _profiled(self, profile:ParseProfile):
+        """
+        Wraps the string conversion, pre-parse functions, matches and field
+        functions of this IType with profiled functions while parsing.
+        """
+        attributes = {name: getattr(self, name) for name in
+                      ['_pre_parse_fns', '_pre_parse_series_fns', '_fields_fields', '_series_post_parse_fn',
+                       '_series_post_parse_series_fn', '_series_str_to_type_fn', '_series_to_series_fn']}
+        match_segments = self._match_segments
+        profiled_segments = {}
+
+        def profiled_match_segments(fused:bool=False, reorder:bool=False) -> list:
+            if (fused, reorder) not in profiled_segments:
+                profiled_segments[(fused, reorder)] = [profile.wrap_segment(segment)
+                                                       for segment in match_segments(fused, reorder)]
+            return profiled_segments[(fused, reorder)]
+
+        self._to_str = profile.wrap('str conversion', 'value', self._to_str)
+        self._to_str_series = profile.wrap('str conversion', 'column', self._to_str_series)
+        self._pre_parse_series_fns = [profile.wrap('pre-parse', getattr(fn, '__name__', repr(fn)), series_fn)
+                                      if series_fn is not None else None
+                                      for fn, series_fn in zip(self._pre_parse_fns, self._pre_parse_series_fns)]
+        self._pre_parse_fns = [profile.wrap('pre-parse', getattr(fn, '__name__', repr(fn)), fn)
+                               for fn in self._pre_parse_fns]
+        self._fields_fields = [(field_name, types.SimpleNamespace(
+                                    series_type=field.series_type,
+                                    post_parse_fn=profile.wrap('field post-parse', field_name, field.post_parse_fn),
+                                    post_parse_series_fn=profile.wrap('field post-parse', field_name,
+                                                                      field.post_parse_series_fn)
+                                                         if field.post_parse_series_fn is not None else None,
+                                    str_to_type_fn=profile.wrap('field type conversion', field_name, field.str_to_type_fn),
+                                    to_series=profile.wrap('field type conversion', field_name, field.to_series)))
+                               for field_name, field in self._fields_fields]
+        self._series_post_parse_fn = profile.wrap('value post-parse', self._series_name, self._series_post_parse_fn)
+        if self._series_post_parse_series_fn is not None:
+            self._series_post_parse_series_fn = profile.wrap('value post-parse', self._series_name,
+                                                             self._series_post_parse_series_fn)
+        self._series_str_to_type_fn = profile.wrap('value type conversion', self._series_name,
+                                                   self._series_str_to_type_fn)
+        self._series_to_series_fn = profile.wrap('value type conversion', self._series_name, self._series_to_series_fn)
+        self._match_segments = profiled_match_segments
+        try:
+            yield profile
+        finally:
+            for name in ['_to_str', '_to_str_series', '_match_segments']:
+                delattr(self, name)
+            for name, value in attributes.items():
+                setattr(self, name, value)
+
+    def _cache_namespace(self) -> bytes:
+        """
+        Hash of everything (besides the original value) the parsed values depend
+        on: the IType class, the registered matches, the pre-parse functions and
+        the fields.
+        """
+        config = (
+            'json',   # format of the stored values
+            self.__class__.__module__, self.__class__.__qualname__,
+            [(match.regexp, match.str_format) for match in self._matches],
+            [(_fn_identity(fn), _fn_identity(series_fn)) for fn, series_fn in zip(self._pre_parse_fns,
+                                                                                   self._pre_parse_series_fns)],
+            (self._series_name, self._series_type,
+             _fn_identity(self._series_post_parse_fn), _fn_identity(self._series_post_parse_series_fn),
+             _fn_identity(self._series_str_to_type_fn), _fn_identity(self._series_to_series_fn)),
+            [(field_name, field.series_type, _fn_identity(field.post_parse_fn), _fn_identity(field.post_parse_series_fn),
+              _fn_identity(field.str_to_type_fn), _fn_identity(field.to_series))
+             for field_name, field in self._fields_fields],
+        )
+        return hashlib.sha256(repr(config).encode()).digest()
+
+    def _parse_cached(self, originals:pd.Series, cache:ParseCache,
+                            parse_fn:Callable[[pd.Series], ParseResult]) -> ParseResult:
+        """
+        Reads the parsed values of the distinct original values from the cache
+        and parses (with `parse_fn`) and stores only the values that are missing.
+        The parsed values only depend on the string value of an original value.
+        Values that exceeded the time budget are not stored.
+        """
+        strings = originals.astype(object).map(str)
+        codes, uniques = pd.factorize(strings, use_na_sentinel=False)
+        namespace = self._cache_namespace()
+        keys = [hashlib.blake2b(namespace + value.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+                for value in uniques]
+
+        result = ParseResult.empty(len(uniques), [field_name for field_name, _ in self._fields_fields])
+        found = {}
+        for key, stored in cache.get_many(keys).items():
+            try:
+                found[key] = self._load_row(stored)
+            except ValueError:   # not a stored row: parsed again
+                pass
+        for position, key in enumerate(keys):
+            if key in found:
+                result.set_row(position, found[key])
+
+        missing = np.array([position for position, key in enumerate(keys) if key not in found], dtype=np.int64)
+        if len(missing) > 0:
+            missing_result = parse_fn(pd.Series(uniques[missing], dtype=object))
+            for i, position in enumerate(missing):
+                result.set_row(position, missing_result.row(i))
+            cache.put_many({keys[position]: self._dump_row(missing_result.row(i))
+                            for i, position in enumerate(missing)
+                            if missing_result.match_ids[i] != ParseResult.TIMEOUT})
+
+        self._cache_stats['hits'] += len(found)
+        self._cache_stats['misses'] += len(missing)
+        return result.take(codes)
+
+    @staticmethod
+    def _dump_row(row:tuple) -> bytes:
+        # JSON instead of pickle: loading a cache file can't run code
+        def to_json(value):
+            return value.item() if isinstance(value, np.generic) else value   # NumPy scalars -> Python numbers
+        string, match_id, value, field_values = row
+        field_values = {field_name: to_json(field_value) for field_name, field_value in field_values.items()}
+        return json.dumps([string, match_id, to_json(value), field_values]).encode('utf-8')
+
+    @staticmethod
+    def _load_row(stored:bytes) -> tuple:
+        row = json.loads(stored)
+        if not (isinstance(row, list) and len(row) == 4 and isinstance(row[1], int) and isinstance(row[3], dict)):
+            raise ValueError("Invalid cached row: {!r}".format(stored[:100]))
+        string, match_id, value, field_values = row
+        return string, match_id, value, field_values
+
+    def _state(self) -> tuple:
+        """
+        Picklable description of the IType: class, constructor arguments, the
+        registered matches and the learned match order. Matches and pre-parse functions can't be pickled
+        (they are bound to this object), so a worker rebuilds them by calling the
+        constructor again.
+        """
+        args, kwargs = getattr(self, '_init_args', ((), {}))
+        state = (self.__class__, args, kwargs, [(m.name, m.regexp, m.str_format, m.prefilter) for m in self._matches],
+                 self._match_order)
+        try:
+            pickle.dumps(state)
+        except Exception as e:
+            raise TypeError("Parsing with multiple processes needs picklable constructor arguments ({})".format(e))
+
+        itype = self._from_state(state, pd.Series([np.nan]))
+        if len(itype._pre_parse_fns) != len(self._pre_parse_fns) or len(itype._fields_fields) != len(self._fields_fields):
+            raise ValueError("Parsing with multiple processes needs pre-parse functions and fields that are " +
+                             "defined by the constructor of {}".format(self.__class__.__name__))
+        return state
+
+    @staticmethod
+    def _from_state(state:tuple, series:pd.Series) -> 'BaseIType':
+        cls, args, kwargs, matches, match_order = state
+        itype = cls(series, *args, **kwargs)
+        if [(m.name, m.regexp, m.str_format, m.prefilter) for m in itype._matches] != matches:   # matches changed after construction
+            itype._matches = []
+            itype._matches_str = []
+            for name, regexp, str_format, prefilter in matches:
+                itype.add_match(name, regexp, str_format, prefilter if prefilter is not None else False)
+        itype._match_order = match_order
+        return itype
+
+    def _parse_chunks(self, originals:pd.Series, engine:str, fused:bool, n_jobs:int, chunksize:int,
+                            pool:Executor=None, reorder:bool=False, time_budget:float=None) -> ParseResult:
+        """
+        Splits the original values in contiguous chunks and parses them in a pool
+        of processes. The results are merged in order.
+        """
+        nr_values = originals.shape[0]
+        if chunksize is None:
+            chunksize = max(1, -(-nr_values // (n_jobs * self.NR_CHUNKS_PER_JOB)))
+        chunks = [originals.iloc[start:start + chunksize] for start in range(0, nr_values, chunksize)]
+        state = self._state()
+        args = ([state] * len(chunks), chunks, [engine] * len(chunks), [fused] * len(chunks), [reorder] * len(chunks),
+                [time_budget] * len(chunks))
+        if pool is not None:
+            results = list(pool.map(_parse_chunk, *args))
+        else:
+            with ProcessPoolExecutor(n_jobs) as pool:
+                results = list(pool.map(_parse_chunk, *args))
+        return ParseResult.concat(results)
+
+    def _failure_value(self, value:str, index, match_id:int=ParseResult.NO_MATCH) -> Value:
+        if match_id == ParseResult.TIMEOUT:
+            messages = [self._timeout_message(value)]
+        else:
+            messages = [self._match_message(match, value) for match in self._matches]
+        return Value(None, None, messages).prefix_messages('index {:>4} :: '.format(index))
+
+    def _result_hit_counts(self, result:ParseResult) -> np.ndarray:
+        return np.bincount(result.match_ids[result.match_ids >= 0], minlength=len(self._matches))
+
+    def _result_failure_counts(self, result:ParseResult, reorder:bool=False) -> np.ndarray:
+        """
+        Number of failed attempts per match: a match fails on every value that
+        can't be parsed and on every value parsed by a match tried later.
+        """
+        order = self._attempt_order(reorder)
+        nr_failed = int((result.match_ids < 0).sum())
+        nr_hits = self._result_hit_counts(result)[order]
+        failure_counts = np.zeros(len(self._matches), dtype=np.int64)
+        failure_counts[order] = nr_failed + (nr_hits[::-1].cumsum()[::-1] - nr_hits)
+        return failure_counts
+
+    def _result_errors(self, result:ParseResult) -> pd.DataFrame:
+        """
+        Compact error table: one row (position, error code) per value that
+        can't be parsed: 'no match', or 'timeout' if the matches exceeded
+        the time budget.
+        """
+        positions = np.flatnonzero(result.match_ids < 0)
+        codes = (result.match_ids[positions] == ParseResult.TIMEOUT).astype(np.int8)
+        return pd.DataFrame({
+            'position': positions,
+            'error': pd.Categorical.from_codes(codes, categories=self.ERROR_CODES),
+        })
+
+    def _add_error_samples(self, reservoir:Reservoir, result:ParseResult, index:pd.Index):
+        if len(self._matches) > 0:
+            positions = np.flatnonzero(result.match_ids < 0)
+            reservoir.add(len(positions), lambda selected: [(result.strings[position], index[position],
+                                                             int(result.match_ids[position]))
+                                                            for position in positions[selected]])
+
+    def _report(self, nr_values:int, nr_failed:int, error_samples:List[Value], failure_counts:np.ndarray,
+                      abort_message:str=None) -> List[Value]:
+        summary = '{} of {} values can\'t be parsed ({} example messages)'.format(nr_failed, nr_values, len(error_samples))
+        if abort_message is not None:
+            summary = '{}, parsing proces aborted...\n\n{}'.format(abort_message, summary)
+        failures = ['match {:>2} :: {:<24} :: failed {}'.format(match_id + 1, match.name, failure_counts[match_id])
+                    for match_id, match in enumerate(self._matches)]
+        return error_samples + [Message('\n{}\n\nusing matches:\n{}\n\nfailures per match:\n{}\n'.format(
+                                        summary, '\n'.join(self._matches_str), '\n'.join(failures)))]
+
+    def parse(self, max_values:int=None, max_messages:int=MAX_NR_ERROR_MESSAGES, verbose=True,
+                    engine:str='row', dedupe:bool=False, fused:bool=False,
+                    n_jobs:int=None, chunksize:int=None, pool:Executor=None, seed:int=None,
+                    reorder:bool=False, cache:ParseCache=None, profile:bool=False,
+                    time_budget:float=None) -> List[Value]:
+        """
+        Parses the original values. Parsing always finishes: values that can't
+        be parsed are registered in the `errors` table and counted per match
+        (`failure_counts`), and a random sample of at most `max_messages` of
+        them is returned (and printed if `verbose`) as example messages.
 
-            if index == self._df.shape[0] - 1:  # last item
-                value_list.append(Message('\nusing matches:\n{}\n'.format('\n'.join(self._matches_str))))
+        The number of values parsed by every match is kept (`hit_counts`). With
+        `reorder` the matches are tried in the learned `match_order`, which is
+        learned again from the hit counts after parsing.
+
+        With a `cache` (`ParseCache`) only the values that are not in the cache
+        are parsed; see `cache_stats`.
+
+        With `profile` the time spent per stage and per match is measured (see
+        the `profile` property) and reported. Profiling needs a parse in this
+        process (no `n_jobs`).
+
+        With a `time_budget` (seconds) the matching of a value is interrupted
+        when it takes longer, and the value is registered as an error with code
+        'timeout'. The budget uses SIGALRM, so it needs a Unix platform and a
+        parse in the main thread (or in worker processes with `n_jobs`).
+        """
+        if engine not in self.PARSE_ENGINES:
+            raise ValueError("`engine` must be one of {} (now engine is {!r})".format(self.PARSE_ENGINES, engine))
+        _check_time_budget(time_budget)
+
+        if profile and n_jobs is not None and (n_jobs < 0 or n_jobs > 1):
+            raise ValueError("Profiling can't measure parsing in multiple processes (now n_jobs is {})".format(n_jobs))
+
+        originals = self._original
+        if max_values is not None and isinstance(max_values, int):
+            originals = originals.iloc[:max_values + 1]
+
+        parse_profile = ParseProfile() if profile else None
+        start = time.perf_counter()
+        with self._profiled(parse_profile) if profile else contextlib.nullcontext():
+            result = self._parse_originals(originals, engine, dedupe, fused, n_jobs, chunksize, pool, reorder, cache,
+                                           time_budget)
+        parse_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self._set_columns(self._original, self._result_columns(result, self._original.index))
+        messages = []
+        if profile:
+            parse_profile.add('write-back', 'columns', time.perf_counter() - start)
+            parse_profile.add('total', 'parse', parse_seconds + time.perf_counter() - start, len(result))
+            self._profile = parse_profile.to_frame()
+            messages.append(Message('profile:\n{}\n'.format(parse_profile)))
+
+        self._parsed_hashes = None
+        self._parsed_match_ids = result.match_ids
+        return self._finish_parse(result, originals.index, max_messages, verbose, seed, reorder,
+                                  'reached maximum number of values' if len(result) < self._original.shape[0] else None,
+                                  messages)
+
+    def _finish_parse(self, result:ParseResult, index:pd.Index, max_messages:int, verbose:bool, seed:int,
+                            reorder:bool, abort_message:str=None, messages:List[Value]=None) -> List[Value]:
+        """
+        Updates the error table and counts of all parsed values, and reports
+        (with example messages of the values in `result`).
+        """
+        parsed = ParseResult(None, self._parsed_match_ids, None, {})
+        self._errors = self._result_errors(parsed)
+        self._failure_counts = self._result_failure_counts(parsed, reorder)
+        self._hit_counts = self._result_hit_counts(parsed)
+        if reorder:
+            self._match_order = self._safe_order(self._hit_counts)
+        reservoir = Reservoir(max_messages, seed)
+        self._add_error_samples(reservoir, result, index)
+        self._error_samples = [self._failure_value(value, index, match_id) for value, index, match_id in reservoir.items]
+        value_list = self._report(len(parsed), self._errors.shape[0], self._error_samples, self._failure_counts,
+                                  abort_message) + (messages if messages is not None else [])
+
+        if result.nr_distinct_values is not None and len(result) > 0:
+            value_list.append(Message('deduplicated values :: {} distinct of {} values (ratio {:.3f})'.format(
+                    result.nr_distinct_values, len(result), result.nr_distinct_values / len(result))))
 
         if verbose:
             messages_list = []
@@ -186,6 +1191,231 @@ class BaseIType(object):
 
         return value_list
 
+    FLOAT_HASH_TAG = np.uint64(0x9E3779B97F4A7C15)   # tells the hashes of floats and integers apart
+
+    @staticmethod
+    def _row_hashes(series:pd.Series) -> np.ndarray:
+        # the parsed values only depend on the string value of an original value
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+            # numbers without strings: integers (and floats) with the same value have the same string value
+            numbers = series.to_numpy()
+            if dtype.kind == 'f':
+                numbers = numbers.astype(np.float64)
+                bits = np.where(np.isnan(numbers), np.nan, numbers).view(np.uint64)   # one NaN: 'nan'
+                return pd.util.hash_array(bits) ^ BaseIType.FLOAT_HASH_TAG
+            if dtype.kind == 'i' or len(numbers) == 0 or numbers.max() < 2**63:
+                return pd.util.hash_array(numbers.astype(np.int64).view(np.uint64))
+        return pd.util.hash_pandas_object(series.astype(object).map(str), index=False).to_numpy()
+
+    def update(self, series:pd.Series, max_messages:int=MAX_NR_ERROR_MESSAGES, verbose=True,
+                     engine:str='row', dedupe:bool=False, fused:bool=False,
+                     n_jobs:int=None, chunksize:int=None, pool:Executor=None, seed:int=None,
+                     reorder:bool=False, cache:ParseCache=None, time_budget:float=None) -> List[Value]:
+        """
+        Incremental parse: replaces the original values by `series` (e.g. the
+        previous column with appended or changed rows) and only parses the rows
+        with a new index entry or a changed value (detected by comparing row
+        hashes). Parsed values of unchanged rows are kept, rows that are not in
+        `series` are removed. The index must be unique.
+        """
+        if not type(series) == type(pd.Series([])):
+            raise TypeError("Input data must be a Pandas Series object (now input type is {})".format(type(series)))
+
+        if not series.index.is_unique:
+            raise ValueError("Updating needs a unique index")
+
+        if not self.is_parsed or self._parsed_match_ids is None:
+            self._set_columns(self._original_column(series), {})
+            return self.parse(None, max_messages, verbose, engine, dedupe, fused, n_jobs, chunksize, pool, seed,
+                              reorder, cache, time_budget=time_budget)
+
+        parsed_index = self._original.index[:len(self._parsed_match_ids)]
+        if not parsed_index.is_unique:
+            raise ValueError("Updating needs a unique index")
+        if self._parsed_hashes is None:   # not on the parse itself: only needed for updates
+            self._parsed_hashes = self._row_hashes(self._original.iloc[:len(self._parsed_match_ids)])
+
+        hashes = self._row_hashes(series)
+        positions = parsed_index.get_indexer(series.index)   # -1: new index entry
+        is_new = positions == -1
+        is_kept = np.zeros(len(series), dtype=bool)
+        old = np.flatnonzero(~is_new)   # only rows with a parsed value are compared (there can be none)
+        is_kept[old] = self._parsed_hashes[positions[old]] == hashes[old]
+        kept = np.flatnonzero(is_kept)
+        delta = np.flatnonzero(~is_kept)
+
+        _check_time_budget(time_budget)
+        result = self._parse_originals(series.iloc[delta], engine, dedupe, fused, n_jobs, chunksize, pool, reorder, cache,
+                                       time_budget)
+        delta_columns = self._result_columns(result, series.index[delta])
+        columns = {}
+        for column_name, delta_column in delta_columns.items():
+            kept_column = self._columns[column_name].iloc[positions[kept]]
+            if isinstance(delta_column.dtype, pd.CategoricalDtype):   # encode both with the union of their categories
+                categories = kept_column.cat.categories.union(delta_column.cat.categories)
+                kept_column = kept_column.cat.set_categories(categories)
+                delta_column = delta_column.cat.set_categories(categories)
+            column = pd.Series(np.nan, index=series.index, name=column_name).astype(delta_column.dtype)
+            column.iloc[kept] = kept_column.array
+            column.iloc[delta] = delta_column.array
+            columns[column_name] = column
+
+        match_ids = np.full(len(series), -1)
+        match_ids[kept] = self._parsed_match_ids[positions[kept]]
+        match_ids[delta] = result.match_ids
+        nr_removed = len(parsed_index) - int((~is_new).sum())
+        self._set_columns(self._original_column(series), columns)
+        self._parsed_hashes = hashes
+        self._parsed_match_ids = match_ids
+        return self._finish_parse(result, series.index[delta], max_messages, verbose, seed, reorder, None, [
+                Message('updated values :: {} new, {} changed, {} unchanged, {} removed'.format(
+                        int(is_new.sum()), len(delta) - int(is_new.sum()), len(kept), nr_removed))])
+
+    def preview(self, n:int=10_000, seed:int=None, confidence:float=0.95, nr_failures:int=10, verbose=True,
+                      engine:str='row', fused:bool=False) -> dict:
+        """
+        Parses a uniform random sample of `n` original values (the parsed values
+        are not kept) to estimate how well the IType fits the column:
+        - `coverage`: per match (and 'no match') the share of the values it
+          parses, with a Wilson confidence interval;
+        - `failures`: the most frequent (pre-parsed) values that can't be parsed;
+        - `projected_seconds`: the projected time of a parse of all values.
+        The coverage table of an empty column (e.g. after an `update`) has no
+        rows.
+        """
+        if engine not in self.PARSE_ENGINES:
+            raise ValueError("`engine` must be one of {} (now engine is {!r})".format(self.PARSE_ENGINES, engine))
+        if n is None or n < 1:
+            raise ValueError("`n` must be at least 1 (now n is {!r})".format(n))
+
+        nr_values = self._original.shape[0]
+        originals = self._sample_originals(n, seed)
+        start = time.perf_counter()
+        result = self._parse_originals(originals, engine, fused=fused)
+        seconds = time.perf_counter() - start
+
+        nr_samples = len(result)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        names = [match.name for match in self._matches] + ['no match']
+        counts = np.append(self._result_hit_counts(result), int((result.match_ids < 0).sum()))
+        if nr_samples == 0:   # empty column: nothing to estimate
+            names, counts = [], counts[:0]
+        sample_size = max(nr_samples, 1)
+        shares = counts / sample_size
+        center = (shares + z**2 / (2 * sample_size)) / (1 + z**2 / sample_size)
+        margin = z / (1 + z**2 / sample_size) * np.sqrt(shares * (1 - shares) / sample_size +
+                                                         z**2 / (4 * sample_size**2))
+        if nr_samples == nr_values:   # all values parsed: no uncertainty
+            center, margin = shares, np.zeros(len(shares))
+        coverage = pd.DataFrame({
+            'match': names,
+            'count': counts,
+            'share': shares,
+            'ci_low': np.where(counts == 0, 0.0, np.clip(center - margin, 0, 1)),
+            'ci_high': np.where(counts == nr_samples, 1.0, np.clip(center + margin, 0, 1)),
+        })
+
+        failures = pd.Series(result.strings[result.match_ids < 0], dtype=object).value_counts().head(nr_failures)
+        failures = failures.rename_axis('value').reset_index(name='count')
+
+        preview = {
+            'nr_samples': nr_samples,
+            'nr_values': nr_values,
+            'confidence': confidence,
+            'coverage': coverage,
+            'failures': failures,
+            'seconds': seconds,
+            'projected_seconds': seconds / nr_samples * nr_values if nr_samples > 0 else 0.0,
+        }
+        if verbose:
+            print('preview of {} of {} values ({:.0%} confidence intervals):\n\n{}\n\nmost frequent failures:\n{}\n\n'
+                  'projected parse time :: {:.2f} seconds\n'.format(
+                  nr_samples, nr_values, confidence, coverage.to_string(index=False),
+                  failures.to_string(index=False), preview['projected_seconds']))
+        return preview
+
+    def parse_iter(self, chunks:Iterable[pd.Series], max_messages:int=MAX_NR_ERROR_MESSAGES,
+                         engine:str='row', dedupe:bool=False, fused:bool=False,
+                         n_jobs:int=None, chunksize:int=None, pool:Executor=None,
+                         seed:int=None, reorder:bool=False, cache:ParseCache=None,
+                         time_budget:float=None) -> Iterator[pd.DataFrame]:
+        """
+        Streaming parse: parses the chunks (e.g. a column of the chunks of
+        `pd.read_csv(..., chunksize=N)`) one by one and yields per chunk a
+        DataFrame with the same columns as the `df` property. The chunks are not
+        kept: only running statistics (`stream_stats`) and a random sample of
+        at most `max_messages` messages (`stream_messages`) are kept over all
+        chunks. With `reorder` the match order is learned again after every chunk.
+
+        Categorical columns (`CategoryField`) are encoded per chunk, with the
+        categories of the chunk: `pd.concat` of the chunks gives a string column.
+        Combine them with `pd.api.types.union_categoricals` to keep them
+        categorical.
+        """
+        self._reset_stream(max_messages, seed)
+        for series in chunks:
+            yield self._parse_stream_chunk(series, engine, dedupe, fused, n_jobs, chunksize, pool, reorder, cache,
+                                           time_budget)
+
+    def _reset_stream(self, max_messages:int=MAX_NR_ERROR_MESSAGES, seed:int=None):
+        self._stream_stats = {
+            'nr_chunks': 0,
+            'nr_values': 0,
+            'nr_parsed': 0,
+            'nr_failed': 0,
+            'nr_matched': {match.name: 0 for match in self._matches},
+            'nr_failed_per_match': {match.name: 0 for match in self._matches},
+        }
+        self._stream_reservoir = Reservoir(max_messages, seed)
+
+    def _parse_stream_chunk(self, series:pd.Series, engine:str='row', dedupe:bool=False, fused:bool=False,
+                                  n_jobs:int=None, chunksize:int=None, pool:Executor=None,
+                                  reorder:bool=False, cache:ParseCache=None, time_budget:float=None) -> pd.DataFrame:
+        if engine not in self.PARSE_ENGINES:
+            raise ValueError("`engine` must be one of {} (now engine is {!r})".format(self.PARSE_ENGINES, engine))
+        _check_time_budget(time_budget)
+
+        result = self._parse_originals(series, engine, dedupe, fused, n_jobs, chunksize, pool, reorder, cache,
+                                       time_budget)
+
+        stats = self._stream_stats
+        stats['nr_chunks'] = stats['nr_chunks'] + 1
+        stats['nr_values'] = stats['nr_values'] + len(result)
+        stats['nr_failed'] = stats['nr_failed'] + int((result.match_ids < 0).sum())
+        stats['nr_parsed'] = stats['nr_values'] - stats['nr_failed']
+        match_ids, counts = np.unique(result.match_ids[result.match_ids >= 0], return_counts=True)
+        for match_id, count in zip(match_ids, counts):
+            stats['nr_matched'][self._matches[match_id].name] += int(count)
+        for match, count in zip(self._matches, self._result_failure_counts(result, reorder)):
+            stats['nr_failed_per_match'][match.name] += int(count)
+        self._hit_counts = np.array([stats['nr_matched'][match.name] for match in self._matches], dtype=np.int64)
+        if reorder:
+            self._match_order = self._safe_order(self._hit_counts)
+        self._add_error_samples(self._stream_reservoir, result, series.index)
+
+        return pd.DataFrame({
+            self.COLUMN_NAME_ORIGINAL: self._original_column(series),
+            **self._result_columns(result, series.index)
+        })
+
+    @property
+    def stream_stats(self) -> dict:
+        return self._stream_stats
+
+    @stream_stats.setter
+    def stream_stats(self, _):
+        raise PermissionError("The stream_stats property is read only")
+
+    @property
+    def stream_messages(self) -> List[Value]:
+        return [self._failure_value(value, index, match_id)
+                for value, index, match_id in self._stream_reservoir.items]
+
+    @stream_messages.setter
+    def stream_messages(self, _):
+        raise PermissionError("The stream_messages property is read only")
+
     def __str__(self):
         return 'Dataframe property:\n' + str(self.df)
 
@@ -0,0 +1,524 @@
+from typing import List, Tuple, Iterator, Set
+import re
+import warnings
+from re import _parser as sre_parse, _constants as sre_constants
+import numpy as np
+import pandas as pd
+
+__all__ = ['Prefilter', 'PrefilterFeatures', 'Match', 'FusedMatch']
+
+
+# -----------------------------------------------------------------------------
+
+
+_SINGLE_CHAR_OPS = (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.IN, sre_constants.ANY)
+_REPEAT_OPS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT)
+_ATOMIC_GROUP = sre_constants.ATOMIC_GROUP
+_MAX_RANGE_SIZE = 1024
+
+
+def _charset(op, av) -> Set[int]:
+    """
+    Code points a single character item can match, or None if the set is
+    unknown or too large (any character, negated sets, categories).
+    """
+    if op is sre_constants.LITERAL:
+        return {av}
+    if op is not sre_constants.IN:
+        return None
+    chars = set()
+    for item_op, item_av in av:
+        if item_op is sre_constants.LITERAL:
+            chars.add(item_av)
+        elif item_op is sre_constants.RANGE and item_av[1] - item_av[0] < _MAX_RANGE_SIZE:
+            chars.update(range(item_av[0], item_av[1] + 1))
+        else:
+            return None
+    return chars
+
+
+def _alphabet(items) -> Set[int]:
+    """
+    All code points a (sub)pattern can consume, or None if unknown.
+    """
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.AT:
+            continue
+        if op in _SINGLE_CHAR_OPS:
+            sub_chars = _charset(op, av)
+        elif op in _REPEAT_OPS:
+            sub_chars = _alphabet(av[2])
+        elif op is sre_constants.SUBPATTERN:
+            sub_chars = _alphabet(av[3]) if av[1] == 0 and av[2] == 0 else None
+        elif op is _ATOMIC_GROUP:
+            sub_chars = _alphabet(av)
+        elif op is sre_constants.BRANCH:
+            branch_chars = [_alphabet(branch) for branch in av[1]]
+            sub_chars = None if None in branch_chars else set().union(*branch_chars)
+        else:   # lookarounds, group references, conditionals
+            sub_chars = None
+        if sub_chars is None:
+            return None
+        chars = chars | sub_chars
+    return chars
+
+
+def _required_charsets(items) -> List[Set[int]]:
+    """
+    Character sets of which every match consumes at least one character.
+    """
+    required = []
+    for op, av in items:
+        if op in _SINGLE_CHAR_OPS:
+            chars = _charset(op, av)
+            if chars is not None:
+                required.append(chars)
+        elif op in _REPEAT_OPS and av[0] > 0:
+            required = required + _required_charsets(av[2])
+        elif op is sre_constants.SUBPATTERN and av[1] == 0 and av[2] == 0:
+            required = required + _required_charsets(av[3])
+        elif op is _ATOMIC_GROUP:
+            required = required + _required_charsets(av)
+    return required
+
+
+def _first_charset(items) -> Tuple[Set[int], bool]:
+    """
+    Code points a (sub)pattern can start with (None if unknown) and whether it
+    can match the empty string.
+    """
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.AT:
+            continue
+        if op in _SINGLE_CHAR_OPS:
+            sub_chars, nullable = _charset(op, av), False
+        elif op in _REPEAT_OPS:
+            sub_chars, nullable = _first_charset(av[2])
+            nullable = nullable or av[0] == 0
+        elif op is sre_constants.SUBPATTERN and av[1] == 0 and av[2] == 0:
+            sub_chars, nullable = _first_charset(av[3])
+        elif op is _ATOMIC_GROUP:
+            sub_chars, nullable = _first_charset(av)
+        elif op is sre_constants.BRANCH:
+            branches = [_first_charset(branch) for branch in av[1]]
+            sub_chars = None if any(c is None for c, _ in branches) else set().union(*[c for c, _ in branches])
+            nullable = any(n for _, n in branches)
+        else:
+            sub_chars, nullable = None, True
+        if sub_chars is None:
+            return None, True
+        chars = chars | sub_chars
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _required_strings(items, max_nr_alternatives:int) -> List[Tuple[str]]:
+    """
+    Strings of which every match contains at least one alternative: runs of
+    literal characters and small character sets.
+    """
+    required = []
+    run = ''
+    for op, av in list(items) + [(None, None)]:
+        if op is sre_constants.LITERAL:
+            run = run + chr(av)
+            continue
+        if run != '':
+            required.append((run,))
+            run = ''
+        if op is sre_constants.IN:
+            chars = _charset(op, av)
+            if chars is not None and len(chars) <= max_nr_alternatives:
+                required.append(tuple(chr(char) for char in sorted(chars)))
+        elif op in _REPEAT_OPS and av[0] > 0:
+            required = required + _required_strings(av[2], max_nr_alternatives)
+        elif op is sre_constants.SUBPATTERN and av[1] == 0 and av[2] == 0:
+            required = required + _required_strings(av[3], max_nr_alternatives)
+        elif op is _ATOMIC_GROUP:
+            required = required + _required_strings(av, max_nr_alternatives)
+    return required
+
+
+def _parse_pattern(pattern:re.Pattern):
+    """
+    Parse tree of a compiled regular expression, or None if it can't be
+    analysed (case insensitive or multiline patterns).
+    """
+    if pattern.flags & (re.IGNORECASE | re.MULTILINE):
+        return None
+    try:
+        return sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+
+# -----------------------------------------------------------------------------
+
+
+class Prefilter(object):
+    """
+    Cheap conditions every value matched by a regular expression meets: a
+    minimum length, the set of possible first characters and required strings
+    (every entry is a tuple of alternatives, at least one must be present).
+    Values that don't pass the prefilter are skipped without running the
+    regular expression.
+    ```
+    Prefilter(required=['@', (',', '#')], first_chars='0123456789', min_length=3)
+    ```
+    """
+
+    MAX_NR_ALTERNATIVES = 4
+
+    def __init__(self, required:list=(), first_chars:str=None, min_length:int=0):
+        self.required = [(r,) if isinstance(r, str) else tuple(r) for r in required]
+        self.first_chars = frozenset(first_chars) if first_chars is not None else None
+        self.min_length = int(min_length)
+
+    @classmethod
+    def from_pattern(cls, pattern:re.Pattern) -> 'Prefilter':
+        """
+        Derives the required strings from the regular expression. The first
+        characters and minimum length are only used if given explicitly: an
+        anchored regular expression rejects those values as fast itself.
+        """
+        tree = _parse_pattern(pattern)
+        if tree is None:
+            return cls()
+        return cls(list(dict.fromkeys(_required_strings(list(tree), cls.MAX_NR_ALTERNATIVES))))
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.required) == 0 and self.first_chars is None and self.min_length == 0
+
+    def accepts(self, value:str) -> bool:
+        if len(value) < self.min_length:
+            return False
+        if self.first_chars is not None and value[:1] not in self.first_chars:
+            return False
+        for alternatives in self.required:
+            for alternative in alternatives:
+                if alternative in value:
+                    break
+            else:
+                return False
+        return True
+
+    def mask(self, features:'PrefilterFeatures') -> np.ndarray:
+        """
+        Column-wise counterpart of `accepts`.
+        """
+        is_accepted = np.ones(features.nr_values, dtype=bool)
+        if self.min_length > 0:
+            is_accepted = is_accepted & (features.lengths >= self.min_length)
+        if self.first_chars is not None:
+            is_accepted = is_accepted & features.first_chars.isin(self.first_chars).to_numpy(dtype=bool)
+        for alternatives in self.required:
+            is_present = np.zeros(features.nr_values, dtype=bool)
+            for alternative in alternatives:
+                is_present = is_present | features.contains(alternative)
+            is_accepted = is_accepted & is_present
+        return is_accepted
+
+    def __eq__(self, other):
+        return isinstance(other, Prefilter) and \
+            (self.required, self.first_chars, self.min_length) == (other.required, other.first_chars, other.min_length)
+
+    def __repr__(self):
+        return 'Prefilter({!r}, {!r}, {!r})'.format(
+                self.required, ''.join(sorted(self.first_chars)) if self.first_chars is not None else None, self.min_length)
+
+
+# -----------------------------------------------------------------------------
+
+
+class PrefilterFeatures(object):
+    """
+    Features of a column of strings used by the prefilters (lengths, first
+    characters and which strings contain a literal). Every feature is computed
+    once and shared by the prefilters of all matches.
+    """
+
+    def __init__(self, strings:pd.Series):
+        self._strings = strings
+        self._lengths = None
+        self._first_chars = None
+        self._contains = {}
+
+    @property
+    def nr_values(self) -> int:
+        return self._strings.shape[0]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        if self._lengths is None:
+            self._lengths = self._strings.str.len().to_numpy()
+        return self._lengths
+
+    @property
+    def first_chars(self) -> pd.Series:
+        if self._first_chars is None:
+            self._first_chars = self._strings.str[:1]
+        return self._first_chars
+
+    def contains(self, literal:str) -> np.ndarray:
+        if literal not in self._contains:
+            self._contains[literal] = self._strings.str.contains(literal, regex=False).to_numpy(dtype=bool)
+        return self._contains[literal]
+
+
+# -----------------------------------------------------------------------------
+
+
+def _candidates_mask(prefilters:List[Prefilter], features:PrefilterFeatures) -> np.ndarray:
+    """
+    Boolean mask of the values accepted by at least one of the prefilters, or
+    None if there is nothing to filter.
+    """
+    if None in prefilters:
+        return None
+    is_candidate = np.zeros(features.nr_values, dtype=bool)
+    for prefilter in prefilters:
+        is_candidate = is_candidate | prefilter.mask(features)
+    return is_candidate
+
+
+def _contains(strings:pd.Series, pattern:re.Pattern, is_candidate:np.ndarray=None) -> np.ndarray:
+    """
+    Boolean mask of the strings that contain a match of the pattern; the
+    pattern only runs on the candidate strings.
+    """
+    candidates = np.arange(strings.shape[0]) if is_candidate is None else np.flatnonzero(is_candidate)
+    is_hit = np.zeros(strings.shape[0], dtype=bool)
+    if len(candidates) > 0:
+        with warnings.catch_warnings():   # `str.contains` warns about match groups
+            warnings.simplefilter('ignore', UserWarning)
+            is_hit[candidates] = strings.iloc[candidates].str.contains(pattern, regex=True).to_numpy(dtype=bool)
+    return is_hit
+
+
+# -----------------------------------------------------------------------------
+
+
+class Match(object):
+    """
+    Registered match of an IType: a named regular expression (compiled once at
+    registration) together with the format string used to build the parsed
+    value out of its groups. The prefilter is derived from the regular
+    expression if it isn't given (`False` for no prefilter).
+    """
+
+    def __init__(self, match_id:int, name:str, regexp:str, str_format:str, prefilter:Prefilter=None):
+        self.match_id = match_id
+        self.name = name
+        self.regexp = regexp
+        self.pattern = re.compile(regexp)
+        self.str_format = str_format
+        if prefilter is None:
+            prefilter = Prefilter.from_pattern(self.pattern)
+        self.prefilter = prefilter if prefilter is not False and not prefilter.is_empty else None
+
+    @property
+    def matches(self) -> List['Match']:
+        return [self]
+
+    @property
+    def is_anchored(self) -> bool:
+        """
+        True if every alternative of the regular expression starts at the
+        beginning of the value (so it can only match at position 0).
+        """
+        if not self.regexp.startswith('^') or self.pattern.flags & re.MULTILINE:
+            return False
+        depth = 0
+        in_class = False
+        escaped = False
+        for char in self.regexp:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif in_class:
+                in_class = char != ']'
+            elif char == '[':
+                in_class = True
+            elif char == '(':
+                depth = depth + 1
+            elif char == ')':
+                depth = depth - 1
+            elif char == '|' and depth == 0:
+                return False
+        return True
+
+    def _parsed_items(self) -> list:
+        tree = _parse_pattern(self.pattern)
+        return list(tree) if tree is not None else None
+
+    def _is_fully_anchored(self, items:list) -> bool:
+        # every match of a pattern anchored at both ends consumes the whole value
+        return (len(items) >= 2 and items[0] == (sre_constants.AT, sre_constants.AT_BEGINNING) and
+                items[-1][0] is sre_constants.AT and
+                items[-1][1] in (sre_constants.AT_END, sre_constants.AT_END_STRING))
+
+    def is_disjoint(self, other:'Match') -> bool:
+        """
+        True if it is proven that no value is matched by both matches, so they
+        can be tried in any order. Two proofs are used: anchored matches that
+        can't start with the same character, and a match that needs a character
+        the other (anchored at both ends) never consumes. False means unknown.
+        """
+        items = self._parsed_items()
+        other_items = other._parsed_items()
+        if items is None or other_items is None:
+            return False
+
+        if (len(items) > 0 and items[0] == (sre_constants.AT, sre_constants.AT_BEGINNING) and
+                len(other_items) > 0 and other_items[0] == (sre_constants.AT, sre_constants.AT_BEGINNING)):
+            first, nullable = _first_charset(items)
+            other_first, other_nullable = _first_charset(other_items)
+            if first is not None and other_first is not None and not nullable and not other_nullable and \
+                    first.isdisjoint(other_first):
+                return True
+
+        for required_items, anchored_items in [(items, other_items), (other_items, items)]:
+            if not self._is_fully_anchored(anchored_items):
+                continue
+            alphabet = _alphabet(anchored_items)
+            if alphabet is None:
+                continue
+            alphabet = alphabet | {ord('\n')}   # `$` also matches before a trailing newline
+            if any(chars.isdisjoint(alphabet) for chars in _required_charsets(required_items)):
+                return True
+        return False
+
+    def search(self, value:str) -> Tuple[int, dict]:
+        """
+        Returns the match id and the named groups, or None if there is no match.
+        """
+        if self.prefilter is not None and not self.prefilter.accepts(value):
+            return None
+        m = self.pattern.search(value)
+        if m is None:
+            return None
+        return self.match_id, m.groupdict()
+
+    def candidates_mask(self, features:PrefilterFeatures) -> np.ndarray:
+        return _candidates_mask([self.prefilter], features)
+
+    def extract(self, strings:pd.Series, is_candidate:np.ndarray=None) -> Iterator[Tuple[int, np.ndarray, pd.DataFrame]]:
+        """
+        Column-wise counterpart of `search`: yields the match id, the boolean mask
+        of matched strings and the named groups of those strings. Only the
+        candidate strings (see `candidates_mask`) are searched.
+        """
+        is_hit = _contains(strings, self.pattern, is_candidate)
+        if is_hit.any():
+            if self.pattern.groups > 0:
+                groups = strings[is_hit].str.extract(self.pattern, expand=True)
+            else:
+                groups = pd.DataFrame(index=strings.index[is_hit])
+            yield self.match_id, is_hit, groups[[column for column in groups.columns if isinstance(column, str)]]
+
+    def __repr__(self):
+        return 'Match({!r}, {!r}, {!r}, {!r}, {!r})'.format(self.match_id, self.name, self.regexp, self.str_format,
+                                                          self.prefilter)
+
+
+# -----------------------------------------------------------------------------
+
+
+class FusedMatch(object):
+    """
+    Consecutive anchored matches joined into one alternation, so a value is
+    scanned once. The groups of every match are made unique by prefixing them
+    with the match id, and every alternative is wrapped in a group that
+    identifies the winning match. Because all alternatives are anchored, the
+    first alternative that matches is the same match as in a one-by-one search.
+    """
+
+    RE_GROUP_NAME = re.compile(r"(?<!\\)\(\?P<([a-zA-Z_][a-zA-Z0-9_]*)>")
+    RE_BACKREFERENCE = re.compile(r"\(\?P=|\\[1-9]")
+
+    def __init__(self, matches:List[Match]):
+        self.matches = matches
+        self._matches_by_branch = {self.branch_name(match.match_id): match for match in matches}
+        self.pattern = re.compile('|'.join('(?P<{}>{})'.format(self.branch_name(match.match_id),
+                                                               self.prefixed_regexp(match))
+                                           for match in matches))
+        # a value is only skipped if the prefilters of all alternatives reject it
+        self._prefilters = [match.prefilter for match in matches]
+        self._has_prefilters = None not in self._prefilters
+
+    @staticmethod
+    def branch_name(match_id:int) -> str:
+        return '_m{}'.format(match_id)
+
+    @classmethod
+    def prefixed_regexp(cls, match:Match) -> str:
+        return cls.RE_GROUP_NAME.sub(r"(?P<{}_\g<1>>".format(cls.branch_name(match.match_id)), match.regexp)
+
+    @classmethod
+    def is_fusable(cls, match:Match) -> bool:
+        if not match.is_anchored or cls.RE_BACKREFERENCE.search(match.regexp) is not None:
+            return False
+        prefix = cls.branch_name(match.match_id) + '_'
+        try:
+            pattern = re.compile(cls.prefixed_regexp(match))
+        except re.error:
+            return False
+        return set(pattern.groupindex) == set(prefix + name for name in match.pattern.groupindex)
+
+    @classmethod
+    def fuse(cls, matches:List[Match]) -> list:
+        """
+        Joins every run of consecutive fusable matches; the other matches are
+        kept as they are. The order of the matches is preserved.
+        """
+        segments = []
+        run = []
+        for match in matches + [None]:
+            if match is not None and cls.is_fusable(match):
+                run.append(match)
+                continue
+            if len(run) > 1:
+                segments.append(cls(run))
+            else:
+                segments.extend(run)
+            run = []
+            if match is not None:
+                segments.append(match)
+        return segments
+
+    def _groups(self, match:Match, get_group) -> dict:
+        prefix = self.branch_name(match.match_id) + '_'
+        return {name: get_group(prefix + name) for name in match.pattern.groupindex}
+
+    def search(self, value:str) -> Tuple[int, dict]:
+        if self._has_prefilters and not any(prefilter.accepts(value) for prefilter in self._prefilters):
+            return None
+        m = self.pattern.search(value)
+        if m is None:
+            return None
+        match = self._matches_by_branch[m.lastgroup]
+        return match.match_id, self._groups(match, m.group)
+
+    def candidates_mask(self, features:PrefilterFeatures) -> np.ndarray:
+        return _candidates_mask(self._prefilters, features)
+
+    def extract(self, strings:pd.Series, is_candidate:np.ndarray=None) -> Iterator[Tuple[int, np.ndarray, pd.DataFrame]]:
+        is_hit = _contains(strings, self.pattern, is_candidate)
+        if is_hit.any():
+            groups = strings[is_hit].str.extract(self.pattern, expand=True)
+            for branch_name, match in self._matches_by_branch.items():
+                is_branch = groups[branch_name].notna().to_numpy(dtype=bool)
+                if is_branch.any():
+                    branch_is_hit = np.zeros(len(is_hit), dtype=bool)
+                    branch_is_hit[np.flatnonzero(is_hit)[is_branch]] = True
+                    branch_groups = groups[is_branch]
+                    yield match.match_id, branch_is_hit, pd.DataFrame(
+                            self._groups(match, lambda column: branch_groups[column]), index=branch_groups.index)
+
+    def __repr__(self):
+        return 'FusedMatch({!r})'.format(self.matches)
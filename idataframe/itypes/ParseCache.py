@@ -0,0 +1,107 @@
+from typing import Dict, List
+import os
+import time
+import sqlite3
+
+__all__ = ['ParseCache']
+
+
+# -----------------------------------------------------------------------------
+
+
+class ParseCache(object):
+    """
+    Persistent on-disk cache of parsed values (a SQLite file). Entries are
+    content addressed: the key is a hash of the IType configuration and the
+    original value (see `BaseIType.parse(cache=...)`), the values are stored as
+    JSON (so a cache file can't run code when it's read). The cache is limited to
+    `max_bytes` of stored values, the least recently used entries are evicted.
+    ```
+    cache = ParseCache('~/.cache/idataframe/addresses.sqlite', max_bytes=64 * 2**20)
+    address = StreetAddressUS(df['address'])
+    address.parse(cache=cache)
+    print(address.cache_stats)
+    ```
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 2**20
+    BATCH_SIZE = 500   # number of keys per SQL statement (SQLite limits the number of parameters)
+
+    def __init__(self, path:str, max_bytes:int=DEFAULT_MAX_BYTES):
+        path = os.path.expanduser(path)
+        if os.path.dirname(path) != '':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.max_bytes = int(max_bytes)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS entries '
+                                 '(key BLOB PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, '
+                                 'last_used INTEGER NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)')
+        self._connection.commit()
+
+    def _batches(self, items:list) -> List[list]:
+        return [items[start:start + self.BATCH_SIZE] for start in range(0, len(items), self.BATCH_SIZE)]
+
+    def get_many(self, keys:List[bytes]) -> Dict[bytes, bytes]:
+        """
+        Stored values of the keys that are in the cache; they become the most
+        recently used entries.
+        """
+        found = {}
+        for batch in self._batches(list(keys)):
+            found.update(self._connection.execute('SELECT key, value FROM entries WHERE key IN ({})'.format(
+                                                  ','.join('?' * len(batch))), batch).fetchall())
+        if len(found) > 0:
+            now = time.time_ns()
+            self._connection.executemany('UPDATE entries SET last_used = ? WHERE key = ?',
+                                         [(now, key) for key in found])
+            self._connection.commit()
+        return found
+
+    def put_many(self, items:Dict[bytes, bytes]):
+        now = time.time_ns()
+        self._connection.executemany('INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)',
+                                     [(key, value, len(key) + len(value), now) for key, value in items.items()])
+        self._evict()
+        self._connection.commit()
+
+    def _evict(self):
+        nr_bytes_to_free = self.nr_bytes - self.max_bytes
+        if nr_bytes_to_free <= 0:
+            return
+        keys = []
+        for key, size in self._connection.execute('SELECT key, size FROM entries ORDER BY last_used'):
+            keys.append(key)
+            nr_bytes_to_free = nr_bytes_to_free - size
+            if nr_bytes_to_free <= 0:
+                break
+        for batch in self._batches(keys):
+            self._connection.execute('DELETE FROM entries WHERE key IN ({})'.format(','.join('?' * len(batch))), batch)
+
+    @property
+    def nr_bytes(self) -> int:
+        return self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    @nr_bytes.setter
+    def nr_bytes(self, _):
+        raise PermissionError("The nr_bytes property is read only")
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def clear(self):
+        self._connection.execute('DELETE FROM entries')
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __repr__(self):
+        return 'ParseCache({!r}, max_bytes={!r})'.format(self.path, self.max_bytes)
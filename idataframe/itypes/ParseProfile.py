@@ -0,0 +1,106 @@
+from typing import Callable, Iterator, Tuple
+import time
+import functools
+import numpy as np
+import pandas as pd
+
+__all__ = ['ParseProfile']
+
+
+# -----------------------------------------------------------------------------
+
+
+class ParseProfile(object):
+    """
+    Wall time, number of calls and number of hits per stage of a parse. The
+    functions of an IType are wrapped (see `wrap` and `wrap_segment`) only
+    while profiling, so a parse without profiling has no overhead.
+    """
+
+    COLUMNS = ['stage', 'name', 'calls', 'hits', 'seconds']
+
+    def __init__(self):
+        self._stages = {}   # (stage, name) -> [calls, hits, seconds]
+
+    def add(self, stage:str, name:str, seconds:float, calls:int=1, hits:int=0):
+        counts = self._stages.setdefault((stage, name), [0, 0, 0.0])
+        counts[0] = counts[0] + calls
+        counts[1] = counts[1] + hits
+        counts[2] = counts[2] + seconds
+
+    def wrap(self, stage:str, name:str, fn:Callable) -> Callable:
+        counts = self._stages.setdefault((stage, name), [0, 0, 0.0])
+
+        def profiled_fn(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                counts[0] = counts[0] + 1
+                counts[2] = counts[2] + time.perf_counter() - start
+        return functools.wraps(fn)(profiled_fn)
+
+    def wrap_segment(self, segment) -> '_ProfiledSegment':
+        return _ProfiledSegment(self, segment)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        One row per stage that was called. If the total time is added (stage
+        'total'), the time that is not measured by a stage is added as 'other'.
+        """
+        stages = {key: counts for key, counts in self._stages.items() if counts[0] > 0}
+        totals = [seconds for (stage, _), (_, _, seconds) in stages.items() if stage == 'total']
+        if len(totals) > 0:
+            measured = sum(seconds for (stage, _), (_, _, seconds) in stages.items() if stage != 'total')
+            stages[('other', 'engine')] = [1, 0, max(sum(totals) - measured, 0.0)]
+        df = pd.DataFrame([(stage, name, calls, hits, seconds)
+                           for (stage, name), (calls, hits, seconds) in stages.items()], columns=self.COLUMNS)
+        df['seconds_per_call'] = df['seconds'] / df['calls']
+        return df
+
+    def __str__(self):
+        return self.to_frame().to_string(index=False)
+
+
+# -----------------------------------------------------------------------------
+
+
+class _ProfiledSegment(object):
+    """
+    Match (or fused match) that records the number of attempts, hits and the
+    time spent searching.
+    """
+
+    def __init__(self, profile:ParseProfile, segment):
+        self._profile = profile
+        self._segment = segment
+        self._name = ' | '.join(match.name for match in segment.matches)
+        self.matches = segment.matches
+
+    def search(self, value:str) -> Tuple[int, dict]:
+        start = time.perf_counter()
+        found = self._segment.search(value)
+        self._profile.add('match', self._name, time.perf_counter() - start, 1, int(found is not None))
+        return found
+
+    def candidates_mask(self, features) -> np.ndarray:
+        start = time.perf_counter()
+        is_candidate = self._segment.candidates_mask(features)
+        self._profile.add('prefilter', self._name, time.perf_counter() - start)
+        return is_candidate
+
+    def extract(self, strings:pd.Series, is_candidate:np.ndarray=None) -> Iterator[Tuple[int, np.ndarray, pd.DataFrame]]:
+        # only the time inside the generator is counted, not the processing of its items
+        nr_attempts = strings.shape[0] if is_candidate is None else int(is_candidate.sum())
+        iterator = self._segment.extract(strings, is_candidate)
+        seconds = 0.0
+        nr_hits = 0
+        while True:
+            start = time.perf_counter()
+            item = next(iterator, None)
+            seconds = seconds + time.perf_counter() - start
+            if item is None:
+                break
+            nr_hits = nr_hits + int(item[1].sum())
+            yield item
+        self._profile.add('match', self._name, seconds, nr_attempts, nr_hits)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Dict, List
+
+import numpy as np
+
+__all__ = ['ParseResult']
+
+
+# -----------------------------------------------------------------------------
+
+
+class ParseResult(object):
+    """
+    Positional buffers filled by a parse engine: the pre-parsed string value,
+    the id of the winning match (`NO_MATCH` if no match succeeded, `TIMEOUT`
+    if the matches ran out of the time budget), the parsed value and the parsed
+    field values of every row. The parsed values of the numeric fast path (see
+    `BaseIType._parse_numeric`) are a float array with NaN for no value.
+
+    `nr_distinct_values` and `distinct` (the code of every row and the result
+    of the distinct values) are set if the values were parsed deduplicated.
+    """
+
+    NO_MATCH = -1
+    TIMEOUT = -2
+
+    def __init__(self, strings:np.ndarray, match_ids:np.ndarray, values:np.ndarray,
+                       field_values:Dict[str, np.ndarray]):
+        self.strings = strings
+        self.match_ids = match_ids
+        self.values = values
+        self.field_values = field_values
+        self.nr_distinct_values = None
+        self.distinct = None
+
+    def __len__(self):
+        return len(self.match_ids)
+
+    @classmethod
+    def empty(cls, nr_values:int, field_names:List[str]) -> ParseResult:
+        return cls(np.full(nr_values, None, dtype=object),
+                   np.full(nr_values, cls.NO_MATCH),
+                   np.full(nr_values, None, dtype=object),
+                   {field_name: np.full(nr_values, None, dtype=object) for field_name in field_names})
+
+    @classmethod
+    def concat(cls, results:List[ParseResult]) -> ParseResult:
+        if len(results) == 0:
+            return cls.empty(0, [])
+        field_names = list(results[0].field_values)
+        return cls(np.concatenate([result.strings for result in results]),
+                   np.concatenate([result.match_ids for result in results]),
+                   np.concatenate([result.values for result in results]),
+                   {field_name: np.concatenate([result.field_values[field_name] for result in results])
+                    for field_name in field_names})
+
+    def row(self, position:int) -> tuple:
+        return (self.strings[position], int(self.match_ids[position]), self.values[position],
+                {field_name: values[position] for field_name, values in self.field_values.items()})
+
+    def set_row(self, position:int, row:tuple):
+        self.strings[position], self.match_ids[position], self.values[position], field_values = row
+        for field_name, value in field_values.items():
+            self.field_values[field_name][position] = value
+
+    def take(self, positions:np.ndarray) -> ParseResult:
+        return self.__class__(self.strings[positions],
+                              self.match_ids[positions],
+                              self.values[positions],
+                              {field_name: values[positions] for field_name, values in self.field_values.items()})
@@ -1,7 +1,9 @@
+from typing import Tuple
 import numpy as np
 import pandas as pd
 
 from idataframe.itypes.BaseIType import BaseIType
+from idataframe.itypes.ParseResult import ParseResult
 from idataframe.scales.IntervalScale import IntervalScale
 from idataframe.fields.IntField import IntField
 from idataframe.fields.IntFloorField import IntFloorField
@@ -19,7 +21,7 @@ class Count(BaseIType, IntervalScale, DiscreteContinuity):
     Positive integer data type.
     """
 
-    RE_COUNT = r"\+?[0-9]+"
+    RE_COUNT = r"\+?[0-9]++"
     RE_AMOUNT = Amount.RE_AMOUNT   # positive float, convert to int
 
     def __init__(self, series:pd.Series, fields=None,
@@ -32,6 +34,7 @@ class Count(BaseIType, IntervalScale, DiscreteContinuity):
             BaseIType.__init__(self, series, fields)
         IntervalScale.__init__(self)
         DiscreteContinuity.__init__(self)
+        self._round_float_to_floor = round_float_to_floor
 
         if fields is None:
             self.add_match(name = 'count',
@@ -41,6 +44,23 @@ class Count(BaseIType, IntervalScale, DiscreteContinuity):
             self.add_match(name = 'amount -> count',
                        regexp = r"^(?P<count>{})$".format(self.RE_AMOUNT),
                        str_format = '{count}')
+            self._numeric_regexps = [r"^(?P<count>{})$".format(Count.RE_COUNT),
+                                     r"^(?P<count>{})$".format(Count.RE_AMOUNT)]
+
+    def _parse_numbers(self, numbers:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if numbers.dtype.kind in 'iu':   # match 'count': integers without a minus sign
+            if not self._is_exact_float(numbers):
+                return None
+            is_count = numbers >= 0
+            return np.where(is_count, 0, ParseResult.NO_MATCH), np.where(is_count, numbers.astype(np.float64), np.nan)
+
+        # match 'amount -> count': finite floats without a minus sign (also not -0.0), rounded like the field
+        values = numbers.astype(np.float64)
+        is_amount = np.isfinite(values) & ~np.signbit(values)
+        values = np.where(is_amount, np.floor(values) if self._round_float_to_floor else np.round(values), np.nan)
+        if (values >= 2.0**63).any():   # too large for the Int64 column
+            return None
+        return np.where(is_amount, 1, ParseResult.NO_MATCH), values
 
     @classmethod
     def from_test_data(cls, *args, **kwargs):
@@ -14,15 +14,15 @@ class Email(Text):
     Email address. Subclass of Text.
     """
 
-    RE_USERNAME = r"[a-zA-Z][a-zA-Z0-9._%+\-]*"
-    RE_DOMAIN = r"[a-zA-Z][a-zA-Z.\-]+\.[a-zA-Z]{2,}"
+    RE_USERNAME = r"[a-zA-Z][a-zA-Z0-9._%+\-]*+"
+    RE_DOMAIN = r"[a-zA-Z][a-zA-Z.\-]+\.[a-zA-Z]{2,}+"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:  # Email type called directly
             Text.__init__(self, series, (
                 ('email', StrField()),
-                ('username', StrField( lambda value: value.lower() )),
-                ('domain', StrField( lambda value: value.lower() )),
+                ('username', StrField( lambda value: value.lower(), lambda values: values.str.lower() )),
+                ('domain', StrField( lambda value: value.lower(), lambda values: values.str.lower() )),
             ))
         else:   # subtype of Email called
             Text.__init__(self, series, fields)
@@ -2,7 +2,7 @@ import pandas as pd
 
 from idataframe.itypes.BaseIType import BaseIType
 from idataframe.scales.NominalScale import NominalScale
-from idataframe.fields.StrField import StrField
+from idataframe.fields.CategoryField import CategoryField
 from idataframe.continuities.DiscreteContinuity import DiscreteContinuity
 
 __all__ = ['Label']
@@ -16,12 +16,12 @@ class Label(BaseIType, NominalScale, DiscreteContinuity):
     Unordered categorical text (less different values).
     """
 
-    RE_LABEL = r".*"
+    RE_LABEL = r".*+"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:   # Label type called directly
             BaseIType.__init__(self, series, (
-                ('label', StrField()),
+                ('label', CategoryField()),
             ))
         else:   # subtype of Label called
             BaseIType.__init__(self, series, fields)
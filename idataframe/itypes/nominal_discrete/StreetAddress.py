@@ -1,13 +1,17 @@
+from typing import Iterator, List, Tuple
 import re
+import functools
+import numpy as np
 import pandas as pd
 
 from idataframe.itypes.nominal_discrete.Text import Text
+from idataframe.itypes.Match import Match
 from idataframe.fields.StrField import StrField
 
-__all__ = ['StreetAddressUS']
+__all__ = ['AddressTokenizer', 'StreetAddressUS']
 
-# list containing all street suffixes and abbreviations
-SUFFIX_EN_LIST = [options_str.split(',') for options_str in re.sub(r"\s", '', """
+# all street suffixes and abbreviations (see `_tables`)
+SUFFIX_EN_DATA = """
 alley,allee,ally,aly|anex,annex,annx,anx|arcade,arc|
 avenue,av,aven,avenu,avn,avnue,ave|bayou,bayoo,byu|beach,bch|bend,bnd|
 bluff,bluf,blf|bluffs,blfs|bottom,bot,bottm,btm|boulevard,boul,boulv,blvd|
@@ -51,89 +55,283 @@ turnpike,turnpk,trnpk,tpke|underpass,upas|union,un|unions,uns|
 valley,vally,vlly,vly|vallyes,vlys|viaduct,vdct,viadct,via|view,vw|views,vws|
 village,vill,villag,village,villg,villiage,vlg|villages,vlgs|ville,vl|
 vista,vist,vst,vsta,vis|walk,walks,walk|wall|way,wy|ways,wys|well,wl|wells,wls
-    """).split('|')]
+    """
 
-# mapping dict to get full names
-SUFFIX_EN_TO_FULL_DICT = { option : options[0] for options in SUFFIX_EN_LIST for option in options[1:] if len(options) > 1 }
+# all directions (see `_tables`)
+DIRECTION_EN_DATA_STR = """
+north|east|south|west|north,east|south,east|north,west|south,west
+    """
 
-# mapping dict to get abbreviations
-SUFFIX_EN_TO_ABBR_DICT = { option : options[-1] for options in SUFFIX_EN_LIST for option in options[:-1] if len(options) > 1 }
+# regexps to normalize all words in one scan
+RE_WORD = re.compile(r"\w+")
+RE_ORDINAL_SUFFIX = re.compile(r"(?<=1)St|(?<=2)Nd|(?<=3)Rd|(?<=[04-9])Th")
+
+def _word_mapping(mapping:dict) -> dict:
+    """
+    Per word the result of replacing every key (as a whole word) by its value,
+    one key after the other in the order of `mapping`. Keys and values are
+    single words, so a value can only be replaced again by a later key.
+    """
+    words = {}
+    for key in mapping:
+        word = key
+        for old, new in mapping.items():
+            if word == old:
+                word = new
+        if word != key:
+            words[key] = word
+    return words
+
+# names of the lookup tables built by `_tables`
+_TABLE_NAMES = ('SUFFIX_EN_LIST', 'SUFFIX_EN_TO_FULL_DICT', 'SUFFIX_EN_TO_ABBR_DICT', 'DIRECTION_EN_DATA',
+                'DIRECTION_EN_RE', 'DIRECTION_EN_TO_FULL_DICT', 'DIRECTION_EN_TO_ABBR_DICT',
+                'SUFFIX_EN_TO_FULL_WORDS', 'DIRECTION_EN_TO_ABBR_WORDS')
+
+@functools.lru_cache(maxsize=None)
+def _tables() -> dict:
+    """
+    Lookup tables of street suffixes and directions. They are built on first
+    use (and are module attributes, see `__getattr__`), so importing the
+    package doesn't build them.
+    """
+    # list containing all street suffixes and abbreviations
+    SUFFIX_EN_LIST = [options_str.split(',') for options_str in re.sub(r"\s", '', SUFFIX_EN_DATA).split('|')]
+
+    # mapping dict to get full names
+    SUFFIX_EN_TO_FULL_DICT = { option : options[0] for options in SUFFIX_EN_LIST for option in options[1:] if len(options) > 1 }
+
+    # mapping dict to get abbreviations
+    SUFFIX_EN_TO_ABBR_DICT = { option : options[-1] for options in SUFFIX_EN_LIST for option in options[:-1] if len(options) > 1 }
+
+    # list containing all directions
+    DIRECTION_EN_DATA = [ el.split(',') for el in re.sub(r"\s", '', DIRECTION_EN_DATA_STR).split('|') ]
+
+    # regexp string to check all variants of directions
+    DIRECTION_EN_RE = '|'.join(
+        ['[{}{}]\.?(?:\.)?(?:{}|{})?'.format(
+            el[0][0].upper(), el[0][0].lower(),
+            el[0][1:].upper(), el[0][1:].lower())
+        for el in DIRECTION_EN_DATA if len(el) == 1]
+        +
+        ['[{}{}]\.?(?:{}|{})?[{}{}]\.?(?:{}|{})?'.format(
+            el[0][0].upper(), el[0][0].lower(),
+            el[0][1:].upper(), el[0][1:].lower(),
+            el[1][0].upper(), el[1][0].lower(),
+            el[1][1:].upper(), el[1][1:].lower())
+        for el in DIRECTION_EN_DATA if len(el) == 2]
+    )
+
+    # mapping dict to get full names
+    DIRECTION_EN_TO_FULL_DICT = {
+        **{ el[0] : el[0]
+               for el in DIRECTION_EN_DATA if len(el) == 1 },
+        **{ el[0][0] : el[0]
+               for el in DIRECTION_EN_DATA if len(el) == 1 },
+        **{ (el[0] + el[1]) : (el[0] + el[1])
+               for el in DIRECTION_EN_DATA if len(el) == 2 },
+        **{ (el[0][0] + el[1][0]) : (el[0] + el[1])
+               for el in DIRECTION_EN_DATA if len(el) == 2 }
+    }
+
+    # mapping dict to get abbreviations
+    DIRECTION_EN_TO_ABBR_DICT = {
+        **{ el[0] : el[0][0]
+               for el in DIRECTION_EN_DATA if len(el) == 1 },
+        **{ el[0][0] : el[0][0]
+               for el in DIRECTION_EN_DATA if len(el) == 1 },
+        **{ (el[0] + el[1]) : (el[0][0] + el[1][0])
+               for el in DIRECTION_EN_DATA if len(el) == 2 },
+        **{ (el[0][0] + el[1][0]) : (el[0][0] + el[1][0])
+               for el in DIRECTION_EN_DATA if len(el) == 2 }
+    }
+
+    # mapping dicts to normalize all words in one scan
+    SUFFIX_EN_TO_FULL_WORDS = _word_mapping(SUFFIX_EN_TO_FULL_DICT)
+    DIRECTION_EN_TO_ABBR_WORDS = _word_mapping(DIRECTION_EN_TO_ABBR_DICT)
+
+    tables = locals()
+    return {name: tables[name] for name in _TABLE_NAMES}
+
+
+def __getattr__(name:str):
+    if name in _TABLE_NAMES:
+        return _tables()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+class _Table(object):
+    """
+    Class attribute with the value of a lookup table, built on first use.
+    """
+
+    def __init__(self, name:str):
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        return _tables()[self._name]
 
-# list containing all directions
-DIRECTION_EN_DATA = [ el.split(',') for el in re.sub(r"\s", '', """
-north|east|south|west|north,east|south,east|north,west|south,west
-    """).split('|') ]
-
-# regexp string to check all variants of directions
-DIRECTION_EN_RE = '|'.join(
-    ['[{}{}]\.?(?:\.)?(?:{}|{})?'.format(
-        el[0][0].upper(), el[0][0].lower(),
-        el[0][1:].upper(), el[0][1:].lower())
-    for el in DIRECTION_EN_DATA if len(el) == 1]
-    +
-    ['[{}{}]\.?(?:{}|{})?[{}{}]\.?(?:{}|{})?'.format(
-        el[0][0].upper(), el[0][0].lower(),
-        el[0][1:].upper(), el[0][1:].lower(),
-        el[1][0].upper(), el[1][0].lower(),
-        el[1][1:].upper(), el[1][1:].lower())
-    for el in DIRECTION_EN_DATA if len(el) == 2]
-)
-
-# mapping dict to get full names
-DIRECTION_EN_TO_FULL_DICT = {
-    **{ el[0] : el[0]
-           for el in DIRECTION_EN_DATA if len(el) == 1 },
-    **{ el[0][0] : el[0]
-           for el in DIRECTION_EN_DATA if len(el) == 1 },
-    **{ (el[0] + el[1]) : (el[0] + el[1])
-           for el in DIRECTION_EN_DATA if len(el) == 2 },
-    **{ (el[0][0] + el[1][0]) : (el[0] + el[1])
-           for el in DIRECTION_EN_DATA if len(el) == 2 }
-}
-
-# mapping dict to get abbreviations
-DIRECTION_EN_TO_ABBR_DICT = {
-    **{ el[0] : el[0][0]
-           for el in DIRECTION_EN_DATA if len(el) == 1 },
-    **{ el[0][0] : el[0][0]
-           for el in DIRECTION_EN_DATA if len(el) == 1 },
-    **{ (el[0] + el[1]) : (el[0][0] + el[1][0])
-           for el in DIRECTION_EN_DATA if len(el) == 2 },
-    **{ (el[0][0] + el[1][0]) : (el[0][0] + el[1][0])
-           for el in DIRECTION_EN_DATA if len(el) == 2 }
-}
+
+# -----------------------------------------------------------------------------
+
+class AddressTokenizer(object):
+    """
+    Parses addresses like the nine anchored matches of `StreetAddressUS`, but
+    in linear time: a value is split once (at the first ',' or '#' and at the
+    spaces) and the tokens are classified as number, direction or street. The
+    first of the nine matches that fits the tokens is returned, with the same
+    groups as the regular expressions. Values with leading, trailing or
+    repeated spaces or a line break (not left by the pre-parse function) are
+    searched with the regular expressions.
+    It is used as a match segment (see `BaseIType._match_segments`), `split`
+    is the batch API.
+    """
+
+    # groups of the nine matches, in order of registration
+    MATCH_GROUPS = [
+        ('number', 'direction', 'street', 'secundary'),
+        ('number', 'street', 'direction', 'secundary'),
+        ('number', 'street', 'secundary'),
+        ('number', 'direction', 'street'),
+        ('number', 'street', 'direction'),
+        ('number', 'street'),
+        ('direction', 'street'),
+        ('street', 'direction'),
+        ('street',),
+    ]
+    RE_SEPARATOR = re.compile(r"[,#]")
+
+    def __init__(self, matches:List[Match], re_number:str, re_direction:str, re_street:str):
+        self.matches = matches
+        self._number = re.compile(re_number)
+        self._direction = re.compile(re_direction)
+        self._street = re.compile(re_street)
+
+    def _fits(self, tokens:List[str], pattern:Tuple[str], trailing_space:bool=False) -> dict:
+        """
+        Groups if the tokens fit the pattern of a match. The street consists of
+        all tokens that are not the number or direction and may have a trailing
+        space (before the separator).
+        """
+        if len(tokens) < len(pattern) - ('secundary' in pattern):
+            return None
+        groups = {}
+        start, end = 0, len(tokens)
+        for name in pattern:
+            if name == 'street':
+                break
+            groups[name] = tokens[start]
+            start = start + 1
+        for name in reversed(pattern):
+            if name == 'secundary':
+                continue
+            if name == 'street':
+                break
+            groups[name] = tokens[end - 1]
+            end = end - 1
+        street = ' '.join(tokens[start:end]) + (' ' if trailing_space and end == len(tokens) else '')
+        if ('number' in groups and self._number.fullmatch(groups['number']) is None or
+                'direction' in groups and self._direction.fullmatch(groups['direction']) is None or
+                start >= end or self._street.fullmatch(street) is None):
+            return None
+        groups['street'] = street
+        return {name: groups[name] for name in pattern if name != 'secundary'}
+
+    def search(self, value:str) -> Tuple[int, dict]:
+        if '\n' in value or '  ' in value or value.startswith(' ') or value.endswith(' '):
+            for match in self.matches:
+                found = match.search(value)
+                if found is not None:
+                    return found
+            return None
+
+        separator = self.RE_SEPARATOR.search(value)
+        head = value if separator is None else value[:separator.start()]
+        trailing_space = head.endswith(' ')
+        tokens = head.split(' ')[:-1] if trailing_space else head.split(' ')
+        patterns = self.MATCH_GROUPS[:3] if separator is not None else self.MATCH_GROUPS[3:]
+        for position, pattern in enumerate(patterns):
+            groups = self._fits(tokens, pattern, trailing_space)
+            if groups is not None:
+                if separator is not None:
+                    groups['secundary'] = value[separator.end():].lstrip(' ')
+                    return self.matches[position].match_id, groups
+                return self.matches[position + 3].match_id, groups
+        return None
+
+    def candidates_mask(self, features) -> np.ndarray:
+        return None
+
+    def extract(self, strings:pd.Series, is_candidate:np.ndarray=None) -> Iterator[Tuple[int, np.ndarray, pd.DataFrame]]:
+        positions = np.arange(strings.shape[0]) if is_candidate is None else np.flatnonzero(is_candidate)
+        found = {}
+        for position, value in zip(positions, strings.iloc[positions]):
+            match = self.search(value)
+            if match is not None:
+                found.setdefault(match[0], []).append((position, match[1]))
+        for match in self.matches:
+            if match.match_id in found:
+                hits = [position for position, _ in found[match.match_id]]
+                is_hit = np.zeros(strings.shape[0], dtype=bool)
+                is_hit[hits] = True
+                yield match.match_id, is_hit, pd.DataFrame([groups for _, groups in found[match.match_id]],
+                                                           index=strings.index[hits], columns=list(match.pattern.groupindex))
+
+    def split(self, strings:pd.Series) -> pd.DataFrame:
+        """
+        Per value the name of the match and its number, direction, street and
+        secundary parts (as they are found, not normalized).
+        """
+        names = {match.match_id: match.name for match in self.matches}
+        rows = []
+        for value in strings:
+            found = self.search(value) if isinstance(value, str) else None
+            rows.append({'match': names[found[0]], **found[1]} if found is not None else {'match': None})
+        return pd.DataFrame(rows, index=strings.index, columns=['match', 'number', 'direction', 'street', 'secundary'])
+
+    def __repr__(self):
+        return 'AddressTokenizer({!r})'.format(self.matches)
 
 # -----------------------------------------------------------------------------
 
 class StreetAddressUS(Text):
     """
     Post address US. Subclass of Text.
+    With `tokenize=True` the addresses are parsed by splitting them into
+    tokens (see `AddressTokenizer`) instead of trying the regular expressions
+    one by one; the parsed values are the same.
     https://zip.postcodebase.com/US_address_format
     https://pe.usps.com/text/pub28/28apc_002.htm
     """
 
-    RE_PRIMARY_ADDRESS_NUMBER = r"[0-9\-/]+[a-zA-Z]?"
-    RE_PRIMARY_ADDRESS_DIRECTION = DIRECTION_EN_RE
-    RE_PRIMARY_ADDRESS_STREET = r"[a-zA-Z0-9.' ]+"
-    RE_SECUNDARY_ADDRESS = r".*"
+    # possessive quantifiers and a street of single-space separated words, so a match never backtracks
+    # over the same characters more than once (linear time, also on long malformed values)
+    RE_PRIMARY_ADDRESS_NUMBER = r"[0-9\-/]++[a-zA-Z]?+"
+    RE_PRIMARY_ADDRESS_DIRECTION = _Table('DIRECTION_EN_RE')
+    RE_PRIMARY_ADDRESS_STREET = r"[a-zA-Z0-9.']++(?:[ ][a-zA-Z0-9.']++)*[ ]?"
+    RE_SECUNDARY_ADDRESS = r".*+"
+
+    def __init__(self, series:pd.Series, fields=None, tokenize:bool=False):
+        if tokenize and fields is not None:
+            raise ValueError("Tokenizing is only possible with the fields and matches of StreetAddressUS")
 
-    def __init__(self, series:pd.Series, fields=None):
+        self._tokenizer = None
+        self._tokenize = tokenize
         if fields is None:   # StreetAddressUS type called directly
             Text.__init__(self, series, (
                 ('address', StrField()),
                 ('number', StrField()),
-                ('direction', StrField(self.parse_direction)),
-                ('street', StrField(self.parse_street)),
-                ('secundary', StrField(self.parse_secundary)),
+                ('direction', StrField(self.parse_direction, pure=True)),
+                ('street', StrField(self.parse_street, pure=True)),
+                ('secundary', StrField(self.parse_secundary, self.parse_secundary_series)),
             ))
         else:   # subtype of StreetAddressUS called
             Text.__init__(self, series, fields)
 
         if fields is None:
-            self.add_pre_parse_fn(self.pre_parse)
+            self.add_pre_parse_fn(self.pre_parse, self.pre_parse_series)
 
             self.add_match(name = 'number direction street, secundary',
-                       regexp = r"^(?P<number>{})[ ]+(?P<direction>{})[ ]+(?P<street>{})[ ]*[,#][ ]*(?P<secundary>{})$".format(
+                       regexp = r"^(?P<number>{})[ ]++(?P<direction>{})[ ]++(?P<street>{})[ ]*+[,#][ ]*+(?P<secundary>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_NUMBER,
                                 self.RE_PRIMARY_ADDRESS_DIRECTION,
                                 self.RE_PRIMARY_ADDRESS_STREET,
@@ -141,7 +339,7 @@ class StreetAddressUS(Text):
                        str_format = '{number} {direction} {street}, {secundary}')
 
             self.add_match(name = 'number street direction, secundary',
-                       regexp = r"^(?P<number>{})[ ]+(?P<street>{})[ ]+(?P<direction>{})[ ]*[,#][ ]*(?P<secundary>{})$".format(
+                       regexp = r"^(?P<number>{})[ ]++(?P<street>{})[ ]++(?P<direction>{})[ ]*+[,#][ ]*+(?P<secundary>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_NUMBER,
                                 self.RE_PRIMARY_ADDRESS_STREET,
                                 self.RE_PRIMARY_ADDRESS_DIRECTION,
@@ -149,40 +347,40 @@ class StreetAddressUS(Text):
                        str_format = '{number} {direction} {street}, {secundary}')
 
             self.add_match(name = 'number street, secundary',
-                       regexp = r"^(?P<number>{})[ ]+(?P<street>{})[ ]*[,#][ ]*(?P<secundary>{})$".format(
+                       regexp = r"^(?P<number>{})[ ]++(?P<street>{})[ ]*+[,#][ ]*+(?P<secundary>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_NUMBER,
                                 self.RE_PRIMARY_ADDRESS_STREET,
                                 self.RE_SECUNDARY_ADDRESS),
                        str_format = '{number} {street}, {secundary}')
 
             self.add_match(name = 'number direction street',
-                       regexp = r"^(?P<number>{})[ ]+(?P<direction>{})[ ]+(?P<street>{})$".format(
+                       regexp = r"^(?P<number>{})[ ]++(?P<direction>{})[ ]++(?P<street>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_NUMBER,
                                 self.RE_PRIMARY_ADDRESS_DIRECTION,
                                 self.RE_PRIMARY_ADDRESS_STREET),
                        str_format = '{number} {direction} {street}')
 
             self.add_match(name = 'number street direction',
-                       regexp = r"^(?P<number>{})[ ]+(?P<street>{})[ ]+(?P<direction>{})$".format(
+                       regexp = r"^(?P<number>{})[ ]++(?P<street>{})[ ]++(?P<direction>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_NUMBER,
                                 self.RE_PRIMARY_ADDRESS_STREET,
                                 self.RE_PRIMARY_ADDRESS_DIRECTION),
                        str_format = '{number} {direction} {street}')
 
             self.add_match(name = 'number street',
-                       regexp = r"^(?P<number>{})[ ]+(?P<street>{})$".format(
+                       regexp = r"^(?P<number>{})[ ]++(?P<street>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_NUMBER,
                                 self.RE_PRIMARY_ADDRESS_STREET),
                        str_format = '{number} {street}')
 
             self.add_match(name = 'direction street',
-                       regexp = r"^(?P<direction>{})[ ]+(?P<street>{})$".format(
+                       regexp = r"^(?P<direction>{})[ ]++(?P<street>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_DIRECTION,
                                 self.RE_PRIMARY_ADDRESS_STREET),
                        str_format = '{direction} {street}')
 
             self.add_match(name = 'street direction',
-                       regexp = r"^(?P<street>{})[ ]+(?P<direction>{})$".format(
+                       regexp = r"^(?P<street>{})[ ]++(?P<direction>{})$".format(
                                 self.RE_PRIMARY_ADDRESS_STREET,
                                 self.RE_PRIMARY_ADDRESS_DIRECTION),
                        str_format = '{direction} {street}')
@@ -192,27 +390,54 @@ class StreetAddressUS(Text):
                                self.RE_PRIMARY_ADDRESS_STREET),
                        str_format = '{street}')
 
+            self._tokenizer = AddressTokenizer(self._matches[:len(AddressTokenizer.MATCH_GROUPS)],
+                                               self.RE_PRIMARY_ADDRESS_NUMBER,
+                                               self.RE_PRIMARY_ADDRESS_DIRECTION,
+                                               self.RE_PRIMARY_ADDRESS_STREET)
+
+    def _match_segments(self, fused:bool=False, reorder:bool=False) -> list:
+        """
+        With `tokenize`, the tokenizer replaces the nine matches of the address
+        (tried first); matches that are added later are tried after it.
+        """
+        segments = super()._match_segments(fused, reorder)
+        if not self._tokenize:
+            return segments
+        tokenized = set(match.match_id for match in self._tokenizer.matches)
+        return [self._tokenizer] + [match for match in self._matches if match.match_id not in tokenized]
+
+    def tokenize(self, series:pd.Series=None) -> pd.DataFrame:
+        """
+        Batch API of the tokenizer: per (pre-parsed) value the name of the
+        match and the number, direction, street and secundary parts. Defaults
+        to the original values.
+        """
+        if self._tokenizer is None:
+            raise ValueError("Tokenizing is only possible with the fields and matches of StreetAddressUS")
+        series = self._original if series is None else series
+        return self._tokenizer.split(self._pre_parse_series(series)).set_index(series.index)
+
     def pre_parse(self, value:str) -> str:
         value = re.sub(r"\b[Nn]/?[Aa]\b", '', value)   # remove 'NA' parts inside string
         value = re.sub(r"\s{2,}", ' ', value.strip())  # convert multiple spaces to one space character
         return value
 
+    def pre_parse_series(self, values:pd.Series) -> pd.Series:
+        values = values.str.replace(r"\b[Nn]/?[Aa]\b", '', regex=True)
+        values = values.str.strip().str.replace(r"\s{2,}", ' ', regex=True)
+        return values
+
     def parse_direction(self, value:str) -> str:
-        value = value.lower()
-        for direction, new_direction in DIRECTION_EN_TO_ABBR_DICT.items():   # instead of ABBR, also FULL is possible
-            value = re.sub(r"\b" + direction + r"\b", new_direction, value)
+        directions = _tables()['DIRECTION_EN_TO_ABBR_WORDS']   # instead of ABBR, also FULL is possible
+        value = RE_WORD.sub(lambda m: directions.get(m[0], m[0]), value.lower())
         value = value.upper()
         return value
 
     def parse_street(self, value:str) -> str:
-        value = value.strip().lower()
-        for suffix, new_suffix in SUFFIX_EN_TO_FULL_DICT.items():   # instead of FULL, also ABBR is possible
-            value = re.sub(r"\b" + suffix + r"\b", new_suffix, value)
+        suffixes = _tables()['SUFFIX_EN_TO_FULL_WORDS']   # instead of FULL, also ABBR is possible
+        value = RE_WORD.sub(lambda m: suffixes.get(m[0], m[0]), value.strip().lower())
         value = value.title()
-        value = re.sub(r"([1])St", '\g<1>st', value)
-        value = re.sub(r"([2])Nd", '\g<1>nd', value)
-        value = re.sub(r"([3])Rd", '\g<1>rd', value)
-        value = re.sub(r"([04-9])Th", '\g<1>th', value)
+        value = RE_ORDINAL_SUFFIX.sub(lambda m: m[0].lower(), value)   # 1St -> 1st, 2Nd -> 2nd, 3Rd -> 3rd, 4Th -> 4th
         return value
 
     def parse_secundary(self, value:str) -> str:
@@ -220,6 +445,9 @@ class StreetAddressUS(Text):
         value = value.upper()
         return value
 
+    def parse_secundary_series(self, values:pd.Series) -> pd.Series:
+        return values.str.strip().str.replace(r"\s{2,}", ' ', regex=True).str.upper()
+
     @classmethod
     def from_test_data(cls, *args, **kwargs):
         return cls(pd.Series([value.strip() for value in """
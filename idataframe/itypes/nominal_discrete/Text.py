@@ -16,7 +16,7 @@ class Text(BaseIType, NominalScale, DiscreteContinuity):
     Unordered text (mostly unique values).
     """
 
-    RE_TEXT = r".*"
+    RE_TEXT = r".*+"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:   # Text type called directly
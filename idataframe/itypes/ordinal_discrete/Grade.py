@@ -16,7 +16,7 @@ class Grade(BaseIType, OrdinalScale, DiscreteContinuity):
     Ordered text.
     """
 
-    RE_GRADE = r".*"
+    RE_GRADE = r".*+"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:   # Grade type called directly
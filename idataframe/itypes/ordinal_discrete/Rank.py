@@ -1,6 +1,9 @@
+from typing import Tuple
+import numpy as np
 import pandas as pd
 
 from idataframe.itypes.BaseIType import BaseIType
+from idataframe.itypes.ParseResult import ParseResult
 from idataframe.scales.OrdinalScale import OrdinalScale
 from idataframe.fields.IntField import IntField
 from idataframe.continuities.DiscreteContinuity import DiscreteContinuity
@@ -16,7 +19,7 @@ class Rank(BaseIType, OrdinalScale, DiscreteContinuity):
     Ordered numerical values (integers), with no constant interval.
     """
 
-    RE_RANK = r"[\+\-]?[0-9]+"
+    RE_RANK = r"[\+\-]?[0-9]++"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:   # Rank type called directly
@@ -32,6 +35,14 @@ class Rank(BaseIType, OrdinalScale, DiscreteContinuity):
             self.add_match(name = 'rank',
                        regexp = r"^(?P<rank>{})$".format(self.RE_RANK),
                        str_format = '{rank}')
+            self._numeric_regexps = [r"^(?P<rank>{})$".format(Rank.RE_RANK)]
+
+    def _parse_numbers(self, numbers:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if numbers.dtype.kind == 'f':   # the string value of a float ('7.0', '1e+16', 'nan') never matches
+            return np.full(len(numbers), ParseResult.NO_MATCH), np.full(len(numbers), np.nan)
+        if not self._is_exact_float(numbers):
+            return None
+        return np.zeros(len(numbers), dtype=np.int64), numbers.astype(np.float64)
 
 
     @classmethod
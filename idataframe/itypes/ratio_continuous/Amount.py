@@ -1,6 +1,8 @@
+from typing import Tuple
 import pandas as pd
 import numpy as np
 
+from idataframe.itypes.ParseResult import ParseResult
 from idataframe.itypes.ratio_continuous.Balance import Balance
 from idataframe.fields.FloatField import FloatField
 
@@ -15,7 +17,7 @@ class Amount(Balance):
     Positive float data type. Subclass of Balance.
     """
 
-    RE_AMOUNT = r"\+?(?:[0-9]+|[0-9]+\.[0-9]+|\.[0-9]+)(?:[eE][\-+]?[0-9]+)?"
+    RE_AMOUNT = r"\+?(?:[0-9]++(?:\.[0-9]++)?|\.[0-9]++)(?:[eE][\-+]?[0-9]++)?"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:   # Amount type called directly
@@ -29,6 +31,13 @@ class Amount(Balance):
             self.add_match(name = 'amount',
                        regexp = r"^(?P<amount>{})$".format(self.RE_AMOUNT),
                        str_format = '{amount}')
+            self._numeric_regexps = [r"^(?P<amount>{})$".format(Amount.RE_AMOUNT)]
+
+    def _parse_numbers(self, numbers:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # finite numbers without a minus sign (also not -0.0)
+        values = numbers.astype(np.float64)
+        is_amount = np.isfinite(values) & ~np.signbit(values)
+        return np.where(is_amount, 0, ParseResult.NO_MATCH), np.where(is_amount, values, np.nan)
 
 
     @classmethod
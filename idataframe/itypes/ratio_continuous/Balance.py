@@ -1,6 +1,9 @@
+from typing import Tuple
+import numpy as np
 import pandas as pd
 
 from idataframe.itypes.BaseIType import BaseIType
+from idataframe.itypes.ParseResult import ParseResult
 from idataframe.scales.RatioScale import RatioScale
 from idataframe.fields.FloatField import FloatField
 from idataframe.continuities.ContinuousContinuity import ContinuousContinuity
@@ -16,7 +19,7 @@ class Balance(BaseIType, RatioScale, ContinuousContinuity):
     Positive or negative float data type.
     """
 
-    RE_BALANCE = r"[\-+]?(?:[0-9]+|[0-9]+\.[0-9]+|\.[0-9]+)(?:[eE][\-+]?[0-9]+)?"
+    RE_BALANCE = r"[\-+]?(?:[0-9]++(?:\.[0-9]++)?|\.[0-9]++)(?:[eE][\-+]?[0-9]++)?"
 
     def __init__(self, series:pd.Series, fields=None):
         if fields is None:   # Balance type called directly
@@ -32,6 +35,13 @@ class Balance(BaseIType, RatioScale, ContinuousContinuity):
             self.add_match(name = 'balance',
                        regexp = r"^(?P<balance>{})$".format(self.RE_BALANCE),
                        str_format = '{balance}')
+            self._numeric_regexps = [r"^(?P<balance>{})$".format(Balance.RE_BALANCE)]
+
+    def _parse_numbers(self, numbers:np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # the string value of every finite number matches ('nan' and 'inf' don't)
+        values = numbers.astype(np.float64)
+        is_balance = np.isfinite(values)
+        return np.where(is_balance, 0, ParseResult.NO_MATCH), np.where(is_balance, values, np.nan)
 
     @classmethod
     def from_test_data(cls, *args, **kwargs):
@@ -0,0 +1,89 @@
+from typing import Callable, Dict
+from collections import OrderedDict
+import functools
+import threading
+
+__all__ = ['LRUCache']
+
+_MISSING = object()
+
+
+# -----------------------------------------------------------------------------
+
+
+class LRUCache(object):
+    """
+    Bounded in-memory cache of the results of pure string functions (e.g.
+    normalizers of parsed values). When more than `max_size` results are
+    stored, the least recently used ones are evicted. One cache can be shared
+    by many functions: the results are stored per function. The cache can be
+    used by several threads at once (the functions themselves are called
+    outside of its lock).
+    ```
+    cache = LRUCache(max_size=10_000)
+    parse_street = cache.memoize(parse_street)
+    print(cache.stats)
+    ```
+    """
+
+    DEFAULT_MAX_SIZE = 2**16
+
+    def __init__(self, max_size:int=DEFAULT_MAX_SIZE):
+        self.max_size = max(int(max_size), 0)
+        self._entries = OrderedDict()   # (function, value) -> result, least recently used first
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+
+    def memoize(self, fn:Callable[[str], object]) -> Callable[[str], object]:
+        """
+        Wraps a pure function of one string: a value it was called with before
+        is a dict lookup. Other values than strings and exceptions are not
+        cached. Bound methods share their results with the same method of other
+        objects.
+        """
+        namespace = getattr(fn, '__func__', fn)
+        entries = self._entries
+        stats = self._stats
+        lock = self._lock
+
+        def memoized_fn(value):
+            if type(value) is not str:
+                return fn(value)
+            key = (namespace, value)
+            with lock:
+                result = entries.get(key, _MISSING)
+                if result is not _MISSING:
+                    stats['hits'] = stats['hits'] + 1
+                    entries.move_to_end(key)
+                    return result
+                stats['misses'] = stats['misses'] + 1
+            result = fn(value)
+            with lock:
+                entries[key] = result
+                entries.move_to_end(key)   # another thread can have stored the key meanwhile
+                while len(entries) > self.max_size:
+                    entries.popitem(last=False)
+                    stats['evictions'] = stats['evictions'] + 1
+            return result
+        return functools.wraps(fn)(memoized_fn)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries), 'max_size': self.max_size}
+
+    @stats.setter
+    def stats(self, _):
+        raise PermissionError("The stats property is read only")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def __repr__(self):
+        return 'LRUCache(max_size={!r})'.format(self.max_size)
@@ -0,0 +1,68 @@
+from typing import Callable, List
+
+import numpy as np
+
+__all__ = ['Reservoir']
+
+
+# -----------------------------------------------------------------------------
+
+
+class Reservoir(object):
+    """
+    Fixed-size uniform random sample of a stream of items.
+
+    Every item gets a random key and the `size` items with the smallest keys
+    are kept (bottom-k sampling), so memory stays constant however many items
+    are added. Items are added in batches; only the items that enter the sample
+    are created (by calling `get_items` with their positions in the batch).
+    With `size=None` all items are kept.
+    ```
+    reservoir = Reservoir(20, seed=42)
+    reservoir.add(len(failed), lambda selected: [messages_of(failed[i]) for i in selected])
+    print(reservoir.nr_seen, reservoir.items)
+    ```
+    """
+
+    def __init__(self, size:int, seed:int=None):
+        self.size = max(int(size), 0) if size is not None else None
+        self.nr_seen = 0
+        self._rng = np.random.default_rng(seed)
+        self._keys = np.empty(0)
+        self._sequence = np.empty(0, dtype=np.int64)
+        self._items = []
+
+    def add(self, nr_items:int, get_items:Callable[[np.ndarray], list]):
+        sequence = np.arange(self.nr_seen, self.nr_seen + nr_items)
+        self.nr_seen = self.nr_seen + nr_items
+        if self.size == 0 or nr_items == 0:
+            return
+        if self.size is None:
+            self._items = self._items + list(get_items(np.arange(nr_items)))
+            return
+
+        keys = self._rng.random(nr_items)
+        candidates = np.arange(nr_items)
+        if len(self._keys) == self.size:   # only items with a smaller key than the largest kept key can enter
+            candidates = candidates[keys < self._keys.max()]
+        if len(candidates) > self.size:
+            candidates = candidates[np.argpartition(keys[candidates], self.size)[:self.size]]
+        if len(candidates) == 0:
+            return
+
+        all_keys = np.concatenate([self._keys, keys[candidates]])
+        all_sequence = np.concatenate([self._sequence, sequence[candidates]])
+        all_items = self._items + list(get_items(candidates))
+        keep = np.argsort(all_keys, kind='stable')[:self.size]
+        keep = keep[np.argsort(all_sequence[keep])]   # in order of arrival
+        self._keys = all_keys[keep]
+        self._sequence = all_sequence[keep]
+        self._items = [all_items[i] for i in keep]
+
+    @property
+    def items(self) -> List:
+        return self._items
+
+    @items.setter
+    def items(self, _):
+        raise PermissionError("The items property is read only")
@@ -3,3 +3,5 @@ from idataframe.tools.display_fn import *
 
 from idataframe.tools.Value import Value, Message, na, is_na
 from idataframe.tools.ValuePipeLine import ValuePipeLine
+from idataframe.tools.Reservoir import Reservoir
+from idataframe.tools.LRUCache import LRUCache
@@ -10,8 +10,4 @@ def list_remove_duplicates(original:List[str]) -> List[str]:
 
     In contrast to 'list(set(original))' the order will be remained. The first occurance will be kept.
     """
-    unique_list = []
-    for el in original:
-        if el not in unique_list:
-            unique_list.append(el)
-    return unique_list
+    return list(dict.fromkeys(original))   # dict keeps the insertion order
@@ -0,0 +1,23 @@
+import sys
+import statistics
+import subprocess
+
+# import time of the package (in fresh processes, without its dependencies numpy and pandas)
+CODE = """
+import sys, time
+import numpy, pandas
+start = time.perf_counter()
+import idataframe as idf
+imported = time.perf_counter()
+itypes = [getattr(idf, name) for name in idf.__all__]
+print(imported - start, time.perf_counter() - start, 'plotnine' in sys.modules or 'scipy' in sys.modules)
+"""
+
+NR_RUNS = 5
+
+runs = [subprocess.run([sys.executable, '-c', CODE], check=True, capture_output=True, text=True).stdout.split()
+        for _ in range(NR_RUNS)]
+print('import idataframe              :: {:.3f} seconds (median of {} runs)'.format(
+      statistics.median(float(run[0]) for run in runs), NR_RUNS))
+print('import idataframe + all ITypes :: {:.3f} seconds'.format(statistics.median(float(run[1]) for run in runs)))
+print('plotnine or SciPy imported     :: {}'.format(runs[0][2]))
@@ -0,0 +1,28 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from idataframe.fields.FloatField import FloatField
+from idataframe.fields.IntField import IntField
+from idataframe.fields.IntFloorField import IntFloorField
+from idataframe.fields.StrField import StrField
+from idataframe.fields.CategoryField import CategoryField
+
+
+class TestToSeries(unittest.TestCase):
+
+    def test_to_series(self):
+        strings = pd.Series(['1', '2.5', '3.5', '-2.5', ' 7.25 ', '1e3', '1_000', 'x', '', 'nan', 'inf'], dtype=object)
+        for field in [FloatField(), IntField(), IntFloorField(), StrField(), CategoryField()]:
+            converted = field.to_series(strings)
+            self.assertEqual(converted.shape[0], strings.shape[0])
+            for string, value in zip(strings, converted):
+                try:
+                    expected = field.str_to_type_fn(string)
+                except:
+                    expected = None
+                if expected is None or (isinstance(expected, float) and np.isnan(expected)):
+                    self.assertTrue(pd.isna(value), (field, string, value))
+                else:
+                    self.assertEqual(value, expected, (field, string))
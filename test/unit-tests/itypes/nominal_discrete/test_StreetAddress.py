@@ -0,0 +1,84 @@
+import re
+import sys
+import time
+import random
+import unittest
+import subprocess
+
+import pandas as pd
+
+import idataframe as idf
+from idataframe.itypes.nominal_discrete.StreetAddress import SUFFIX_EN_TO_FULL_DICT, DIRECTION_EN_TO_ABBR_DICT
+
+
+def parse_direction_per_suffix(value):
+    value = value.lower()
+    for direction, new_direction in DIRECTION_EN_TO_ABBR_DICT.items():
+        value = re.sub(r"\b" + direction + r"\b", new_direction, value)
+    return value.upper()
+
+
+def parse_street_per_suffix(value):
+    value = value.strip().lower()
+    for suffix, new_suffix in SUFFIX_EN_TO_FULL_DICT.items():
+        value = re.sub(r"\b" + suffix + r"\b", new_suffix, value)
+    value = value.title()
+    value = re.sub(r"([1])St", r'\g<1>st', value)
+    value = re.sub(r"([2])Nd", r'\g<1>nd', value)
+    value = re.sub(r"([3])Rd", r'\g<1>rd', value)
+    value = re.sub(r"([04-9])Th", r'\g<1>th', value)
+    return value
+
+
+class TestStreetAddressUS(unittest.TestCase):
+
+    def setUp(self):
+        self.obj = idf.StreetAddressUS(pd.Series(['1 Main St']))
+
+    def test_normalize(self):
+        words = (list(SUFFIX_EN_TO_FULL_DICT) + list(DIRECTION_EN_TO_ABBR_DICT) +
+                 ['ST', 'Ave.', '1st', '21ST', '42nd', '3RD', '13th', '0th', 'west-27th', 'é', 'st_', 'O\'Brien', 'n/e'])
+        rng = random.Random(0)
+        for _ in range(2000):
+            value = rng.choice(['', ' ']) + rng.choice([' ', '  ', '.', ', ']).join(
+                    rng.choice(words) for _ in range(rng.randint(1, 5)))
+            self.assertEqual(self.obj.parse_street(value), parse_street_per_suffix(value), value)
+            self.assertEqual(self.obj.parse_direction(value), parse_direction_per_suffix(value), value)
+
+    def test_tokenize(self):
+        words = ['12', '12A', '1-3/4', 'N', 'n.', 'N.E.', 'North', 'NOrth', 'Main', 'St', "O'Hara", '5th', 'x-y', 'é', '3B']
+        rng = random.Random(0)
+        values = [''.join(rng.choice(words) + rng.choice([' ', ' ', '  ', ', ', ' ,', '#', '\n'])
+                          for _ in range(rng.randint(1, 5))).strip() for _ in range(500)]
+        series = pd.concat([idf.StreetAddressUS.from_test_data().series, pd.Series(values)], ignore_index=True)
+        for engine in idf.StreetAddressUS.PARSE_ENGINES:
+            obj = idf.StreetAddressUS(series)
+            obj.parse(verbose=False, engine=engine)
+            obj_tokenize = idf.StreetAddressUS(series, tokenize=True)
+            obj_tokenize.parse(verbose=False, engine=engine)
+            pd.testing.assert_frame_equal(obj.df, obj_tokenize.df)
+            self.assertEqual(obj.hit_counts, obj_tokenize.hit_counts)
+
+        parts = idf.StreetAddressUS(pd.Series(['250 WEST 27TH   STREET, 3B', 'N BROADWAY', 'x-y'], index=[5, 6, 7])).tokenize()
+        self.assertEqual(parts.index.tolist(), [5, 6, 7])
+        self.assertEqual(parts.loc[5].tolist(), ['number direction street, secundary', '250', 'WEST', '27TH STREET', '3B'])
+        self.assertEqual(parts.loc[6, ['match', 'direction', 'street']].tolist(), ['direction street', 'N', 'BROADWAY'])
+        self.assertTrue(parts.loc[7].isna().all())
+
+    def test_linear_patterns(self):
+        # long malformed values (e.g. a run of spaces before a non-direction) used to backtrack quadratically
+        obj = idf.StreetAddressUS.from_test_data()
+        for value in ['12 a' + ' ' * 20000 + '!', '12 ' + 'a ' * 10000 + '!', '1' * 20000 + 'x', 'a, ' + ' ' * 20000]:
+            start = time.perf_counter()
+            for match in obj._matches:
+                match.search(value)
+            self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_lazy_tables(self):
+        # importing the package doesn't build the lookup tables
+        code = ('import idataframe\n'
+                'from idataframe.itypes.nominal_discrete import StreetAddress\n'
+                'assert StreetAddress._tables.cache_info().currsize == 0\n'
+                'assert StreetAddress.StreetAddressUS.RE_PRIMARY_ADDRESS_DIRECTION.startswith("[Nn]")\n'
+                'assert StreetAddress._tables.cache_info().currsize == 1\n')
+        subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,440 @@
+import os
+import json
+import pickle
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import idataframe as idf
+from idataframe.fields.BaseField import BaseField
+from idataframe.fields.StrField import StrField
+from idataframe.itypes.Match import Prefilter, Match, FusedMatch
+
+
+ITYPES = [idf.Email, idf.Label, idf.StreetAddressUS, idf.Text, idf.Grade,
+          idf.Rank, idf.Count, idf.Amount, idf.Balance]
+
+
+class TestParse(unittest.TestCase):
+
+    def parse(self, itype, *args, **kwargs):
+        obj = itype.from_test_data()
+        value_list = obj.parse(*args, verbose=False, **kwargs)
+        return obj, [v.messages for v in value_list]
+
+    def test_engine_vectorized(self):
+        for itype in ITYPES:
+            for kwargs in [{}, {'max_values': 3}, {'max_messages': 0}]:
+                obj_row, messages_row = self.parse(itype, **kwargs)
+                obj_vec, messages_vec = self.parse(itype, engine='vectorized', **kwargs)
+                pd.testing.assert_frame_equal(obj_row.df, obj_vec.df)
+                self.assertEqual(messages_row, messages_vec)
+
+        self.assertRaises(ValueError, lambda: self.parse(idf.Label, engine='unknown'))
+
+    def test_fused(self):
+        for itype in ITYPES:
+            obj, messages = self.parse(itype)
+            for engine in itype.PARSE_ENGINES:
+                obj_fused, messages_fused = self.parse(itype, engine=engine, fused=True)
+                pd.testing.assert_frame_equal(obj.df, obj_fused.df)
+                self.assertEqual(messages, messages_fused)
+
+        obj = idf.Text(pd.Series(['ab', 'b', 'xb']), (('text', StrField()), ('x', StrField())))
+        obj.add_match('a', r"^(?P<x>a)", '{x}')
+        obj.add_match('b or c', r"^c|(?P<x>b)", '{x}')   # not anchored, so not fused
+        obj.add_match('a again', r"^(?P<x>a)(?P=x)", '{x}')   # backreference, not fused
+        obj.add_match('any', r"^(?P<x>.)", '{x}')
+        obj.add_match('any 2', r"^(?P<x>..)", '{x}')
+        segments = obj._match_segments(fused=True)
+        self.assertEqual([type(segment) for segment in segments], [Match, Match, Match, FusedMatch])
+        obj.parse(verbose=False, fused=True)
+        self.assertEqual(obj.df['text'].tolist(), ['a', 'b', 'b'])
+
+    def test_parsed_values(self):
+        obj, _ = self.parse(idf.Email, engine='vectorized')
+        self.assertEqual(obj.df['domain'].tolist()[:2], ['bar.com', 'bla.org'])
+        self.assertTrue(pd.isna(obj.df['email'].iloc[3]))
+
+        obj, _ = self.parse(idf.Count, engine='vectorized')
+        self.assertEqual(obj.df['count'].iloc[8], 8)
+        self.assertTrue(pd.isna(obj.df['count'].iloc[7]))
+
+    def test_non_range_index(self):
+        series = pd.Series(['12', 'x', '7.6', '3'], index=['d', 'c', 'b', 'a'])
+        for engine in idf.Count.PARSE_ENGINES:
+            obj = idf.Count(series)
+            value_list = obj.parse(max_values=2, verbose=False, engine=engine)
+            self.assertEqual(list(obj.df.index), ['d', 'c', 'b', 'a'])
+            self.assertEqual(obj.df['count'].tolist()[:3], [12, pd.NA, 8])
+            self.assertTrue(pd.isna(obj.df['count'].iloc[3]))   # beyond max_values
+            self.assertIn('index    c', value_list[0].messages[0])
+            self.assertIn('maximum number of values', value_list[-1].message)
+
+    def test_dedupe(self):
+        series = pd.Series(['foo@bar.com', 'x', 'Foo@Bar.com', 'foo@bar.com', 'x', np.nan])
+        for engine in idf.Email.PARSE_ENGINES:
+            obj = idf.Email(series)
+            messages = [v.messages for v in obj.parse(verbose=False, engine=engine)]
+            obj_dedupe = idf.Email(series)
+            value_list = obj_dedupe.parse(verbose=False, engine=engine, dedupe=True)
+            pd.testing.assert_frame_equal(obj.df, obj_dedupe.df)
+            self.assertEqual(messages, [v.messages for v in value_list[:-1]])
+            self.assertIn('4 distinct of 6 values', value_list[-1].message)
+
+    def test_n_jobs(self):
+        for itype in [idf.StreetAddressUS, idf.Count]:
+            obj, messages = self.parse(itype)
+            obj_jobs, messages_jobs = self.parse(itype, n_jobs=2, chunksize=2)
+            pd.testing.assert_frame_equal(obj.df, obj_jobs.df)
+            self.assertEqual(messages, messages_jobs)
+
+        obj = idf.Count(pd.Series([1.5, 2.5, 'x']), round_float_to_floor=True)
+        obj.parse(verbose=False, n_jobs=2, chunksize=1)
+        self.assertEqual(obj.df['count'].tolist()[:2], [1, 2])
+
+        obj = idf.Text(pd.Series(['a', 'b', 'c']), (('text', StrField()),))   # user-defined field with defaults
+        obj.add_match(name='text', regexp=r"^(?P<text>.*)$", str_format='{text}')
+        obj.parse(verbose=False, n_jobs=2, chunksize=1)
+        self.assertEqual(obj.df['text'].tolist(), ['a', 'b', 'c'])
+
+    def test_parse_iter(self):
+        series = pd.Series(['12', 'x', '7.6', '3', 'y', '-1', '5'], index=range(10, 17))
+        obj = idf.Count(series)
+        obj.parse(max_messages=None, verbose=False)
+
+        obj_stream = idf.Count(series.iloc[:1])
+        chunks = list(obj_stream.parse_iter([series.iloc[:3], series.iloc[3:]], max_messages=2))
+        pd.testing.assert_frame_equal(obj.df, pd.concat(chunks))
+        self.assertEqual(obj_stream.stream_stats['nr_values'], 7)
+        self.assertEqual(obj_stream.stream_stats['nr_failed'], 3)
+        self.assertEqual(obj_stream.stream_stats['nr_matched'], {'count': 3, 'amount -> count': 1})
+        self.assertEqual(obj_stream.stream_stats['nr_failed_per_match'], {'count': 4, 'amount -> count': 3})
+        self.assertEqual(len(obj_stream.stream_messages), 2)
+        for value in obj_stream.stream_messages:
+            self.assertRegex(value.message, r"^index   1[145] :: ")
+
+    def test_errors(self):
+        series = pd.Series(['12', 'x', '7.6', '3', 'y', '-1', '5'] * 10)
+        for engine in idf.Count.PARSE_ENGINES:
+            obj = idf.Count(series)
+            value_list = obj.parse(max_messages=5, verbose=False, engine=engine, seed=0)
+            self.assertEqual(obj.df['count'].notna().sum(), 40)   # parsing doesn't abort
+            self.assertEqual(obj.errors['position'].tolist()[:3], [1, 4, 5])
+            self.assertEqual(list(obj.errors.columns), ['position', 'error'])
+            self.assertEqual(set(obj.errors['error']), {'no match'})
+            self.assertEqual(obj.failure_counts, {'count': 40, 'amount -> count': 30})
+            self.assertEqual(len(obj.error_samples), 5)
+            self.assertEqual(value_list[:-1], obj.error_samples)
+            self.assertIn('30 of 70 values can\'t be parsed', value_list[-1].message)
+
+    def test_match_order(self):
+        self.assertTrue(Match(0, 'a', r"^[0-9]+$", '').is_disjoint(Match(1, 'b', r"^[a-z]+$", '')))
+        self.assertTrue(Match(0, 'a', r"^[0-9]+, .*", '').is_disjoint(Match(1, 'b', r"^[0-9 ]+$", '')))
+        self.assertFalse(Match(0, 'a', r"^[0-9]+", '').is_disjoint(Match(1, 'b', r"^[0-9a-z]+$", '')))
+        self.assertFalse(Match(0, 'a', r"[0-9]+$", '').is_disjoint(Match(1, 'b', r"^[a-z]+", '')))
+
+        series = pd.Series(['12 Main Street'] * 5 + ['280 WEST 3RD STREET', 'N Main St', '4 N Broadway, apt 3'])
+        obj = idf.StreetAddressUS(series)
+        obj.parse(verbose=False)
+        self.assertEqual(obj.hit_counts['number street'], 5)
+        self.assertEqual(obj.match_order, [match.name for match in obj._matches])
+
+        match_order = obj.learn_match_order()
+        self.assertLess(match_order.index('number street'), match_order.index('number direction street, secundary'))
+        self.assertLess(match_order.index('number direction street'), match_order.index('number street'))
+        for engine in idf.StreetAddressUS.PARSE_ENGINES:
+            obj_reorder = idf.StreetAddressUS(series)
+            obj_reorder.set_match_order(match_order)
+            obj_reorder.parse(verbose=False, engine=engine, fused=True, reorder=True)
+            pd.testing.assert_frame_equal(obj.df, obj_reorder.df)
+            self.assertLess(obj_reorder.failure_counts['number street, secundary'],
+                            obj.failure_counts['number street, secundary'])
+
+        self.assertRaises(ValueError, lambda: obj.set_match_order(list(reversed(match_order))))
+
+    def test_prefilter(self):
+        self.assertEqual(Match(0, 'a', r"^(?P<x>[a-z]+)@(?P<y>[a-z]+)\.com$", '').prefilter.required, [('@',), ('.com',)])
+        self.assertEqual(Match(0, 'a', r"^[0-9]+ *[,#] *(?:ab|c)+", '').prefilter.required, [('#', ',')])
+        self.assertIsNone(Match(0, 'a', r"(?i)^a@b", '').prefilter)
+        self.assertIsNone(Match(0, 'a', r"^a@b", '', False).prefilter)
+
+        prefilter = Prefilter(required=['@', (',', '#')], first_chars='0123456789', min_length=5)
+        self.assertEqual([prefilter.accepts(value) for value in ['1@a,b', '1@a#', 'a@1,b', '1@ab1', '']],
+                         [True, False, False, False, False])
+
+        series = pd.Series(['12 N Main St, apt 3', '12 Main St', 'x@y', '7@z, 1', '7'])
+        for engine in idf.Text.PARSE_ENGINES:
+            for fused in [False, True]:
+                obj = idf.Text(series, (('text', StrField()),))
+                obj.add_match('number@', r"^(?P<text>[0-9]+@.*)", '{text}', Prefilter(first_chars='0123456789'))
+                obj.add_match('address, secundary', r"^(?P<text>[0-9]+ [A-Za-z ]+)[,#]", '{text}')
+                obj.add_match('any', r"^(?P<text>.+)$", '{text}', False)
+                obj.parse(verbose=False, engine=engine, fused=fused)
+                self.assertEqual(obj.df['text'].tolist(), ['12 N Main St', '12 Main St', 'x@y', '7@z, 1', '7'])
+                self.assertEqual(obj.hit_counts, {'number@': 1, 'address, secundary': 1, 'any': 3})
+
+    def test_cache(self):
+        series = pd.Series(['12 Main Street', 'N Main St', '12 Main Street', np.nan, 'x, y'])
+        obj = idf.StreetAddressUS(series)
+        obj.parse(verbose=False)
+        with tempfile.TemporaryDirectory() as directory:
+            with idf.ParseCache(os.path.join(directory, 'cache.sqlite')) as cache:
+                for engine, cache_stats in [('row', {'hits': 0, 'misses': 4}), ('vectorized', {'hits': 4, 'misses': 0})]:
+                    obj_cache = idf.StreetAddressUS(series)
+                    obj_cache.parse(verbose=False, engine=engine, cache=cache)
+                    pd.testing.assert_frame_equal(obj.df, obj_cache.df)
+                    self.assertEqual(obj_cache.cache_stats, cache_stats)
+
+                obj_cache = idf.StreetAddressUS(series.iloc[:3])
+                obj_cache.add_match('any', r"^(?P<street>.*)$", '{street}')   # other configuration: other keys
+                obj_cache.parse(verbose=False, cache=cache)
+                self.assertEqual(obj_cache.cache_stats, {'hits': 0, 'misses': 2})
+                self.assertEqual(len(cache), 6)
+
+                for engine in idf.Count.PARSE_ENGINES:   # NumPy and Python numbers, NaN and failures
+                    count = pd.Series(['12', '7.6', 'x', 'nan', '3'])
+                    obj_count = idf.Count(count)
+                    obj_count.parse(verbose=False, engine=engine)
+                    for _ in range(2):   # misses, then hits
+                        obj_cache = idf.Count(count)
+                        obj_cache.parse(verbose=False, engine=engine, cache=cache)
+                        pd.testing.assert_frame_equal(obj_count.df, obj_cache.df)
+                        pd.testing.assert_frame_equal(obj_count.errors, obj_cache.errors)
+                    self.assertEqual(obj_cache.cache_stats, {'hits': 5, 'misses': 0})
+
+                keys = [key for key, in cache._connection.execute('SELECT key FROM entries')]
+                for value in cache.get_many(keys).values():
+                    self.assertIsInstance(json.loads(value), list)   # JSON, not pickle
+                cache.put_many({key: pickle.dumps(('x', 0, 'x', {})) for key in keys})   # not JSON: parsed again
+                obj_cache = idf.StreetAddressUS(series)
+                obj_cache.parse(verbose=False, cache=cache)
+                pd.testing.assert_frame_equal(obj.df, obj_cache.df)
+                self.assertEqual(obj_cache.cache_stats, {'hits': 0, 'misses': 4})
+
+            with idf.ParseCache(os.path.join(directory, 'cache.sqlite'), max_bytes=0) as cache:
+                self.assertEqual(len(cache.get_many([b'x'])), 0)
+                cache.put_many({b'a': b'1', b'b': b'2'})
+                self.assertEqual(len(cache), 0)   # evicted
+
+            with idf.ParseCache(os.path.join(directory, 'lru.sqlite'), max_bytes=4) as cache:
+                cache.put_many({b'a': b'1', b'b': b'2'})
+                self.assertEqual(cache.get_many([b'a']), {b'a': b'1'})
+                cache.put_many({b'c': b'3'})
+                self.assertEqual(cache.get_many([b'a', b'b', b'c']), {b'a': b'1', b'c': b'3'})
+
+    def test_update(self):
+        series = pd.Series(['12', 'x', '7.6', '3'], index=['a', 'b', 'c', 'd'])
+        new_series = pd.Series(['5', 'x', '7.6', 'y', '8'], index=['e', 'b', 'c', 'd', 'f'])
+        for engine in idf.Count.PARSE_ENGINES:
+            obj = idf.Count(series)
+            obj.parse(verbose=False, engine=engine)
+            self.assertIsNone(obj._parsed_hashes)   # the rows are only hashed for an update
+            value_list = obj.update(new_series, verbose=False, engine=engine)
+            obj_new = idf.Count(new_series)
+            obj_new.parse(verbose=False, engine=engine)
+            pd.testing.assert_frame_equal(obj.df, obj_new.df)
+            pd.testing.assert_frame_equal(obj.errors, obj_new.errors)
+            self.assertEqual(obj.failure_counts, obj_new.failure_counts)
+            self.assertEqual(len(obj.error_samples), 1)   # only the parsed rows are reported
+            self.assertIn('2 new, 1 changed, 2 unchanged, 1 removed', value_list[-1].message)
+
+        self.assertRaises(ValueError, lambda: obj.update(pd.Series(['1', '2'], index=['a', 'a'])))
+
+        obj.update(pd.Series([], dtype=object), verbose=False)   # empty column
+        self.assertEqual(obj.df.shape[0], 0)
+        obj.update(pd.Series(['5', 'x']), verbose=False)
+        self.assertEqual(obj.df['count'].tolist()[:1], [5])
+        self.assertEqual(obj.errors['position'].tolist(), [1])
+
+    def test_profile(self):
+        for engine in idf.Email.PARSE_ENGINES:
+            obj, messages = self.parse(idf.Email, engine=engine)
+            obj_profile, messages_profile = self.parse(idf.Email, engine=engine, profile=True)
+            pd.testing.assert_frame_equal(obj.df, obj_profile.df)
+            self.assertEqual(messages, messages_profile[:-1])
+            self.assertIn('profile:', messages_profile[-1][0])
+
+            profile = obj_profile.profile.set_index(['stage', 'name'])
+            self.assertEqual(profile.loc[('match', 'username@domain'), 'hits'], obj_profile.hit_counts['username@domain'])
+            self.assertEqual(profile.loc[('field post-parse', 'domain'), 'calls'],   # vectorized: once per column
+                             obj_profile.hit_counts['username@domain'] if engine == 'row' else 1)
+            self.assertIn(('write-back', 'columns'), profile.index)
+            self.assertNotIn('_to_str', obj_profile.__dict__)   # unwrapped after parsing
+
+        self.assertRaises(ValueError, lambda: self.parse(idf.Email, n_jobs=2, profile=True))
+
+    def test_preview(self):
+        series = pd.Series(['12', 'x', '7.6', '3'] * 250)
+        obj = idf.Count(series)
+        preview = obj.preview(100, seed=0, verbose=False)
+        self.assertFalse(obj.is_parsed)
+        self.assertEqual(preview['nr_samples'], 100)
+        coverage = preview['coverage'].set_index('match')
+        self.assertEqual(coverage['count'].sum(), 100)
+        for match, share in [('count', 0.5), ('amount -> count', 0.25), ('no match', 0.25)]:
+            self.assertLess(coverage.loc[match, 'ci_low'], share)
+            self.assertGreater(coverage.loc[match, 'ci_high'], share)
+        self.assertEqual(preview['failures']['value'].tolist(), ['x'])
+        self.assertGreater(preview['projected_seconds'], preview['seconds'])
+
+        preview = obj.preview(seed=0, verbose=False)   # all values
+        self.assertEqual(preview['coverage']['share'].tolist(), [0.5, 0.25, 0.25])
+        self.assertEqual(preview['coverage']['ci_low'].tolist(), [0.5, 0.25, 0.25])
+
+        for n in [0, -1]:   # no sample
+            self.assertRaises(ValueError, lambda: obj.preview(n, verbose=False))
+        obj.update(pd.Series([], dtype=object), verbose=False)   # empty column
+        preview = obj.preview(verbose=False)
+        self.assertEqual(preview['nr_samples'], 0)
+        self.assertEqual(preview['coverage'].shape[0], 0)
+
+    def test_arrow_strings(self):
+        series = pd.Series(['foo@bar.com', 'x', np.nan, 'Foo@Bar.com'], dtype=object)
+        for engine in idf.Email.PARSE_ENGINES:
+            obj = idf.Email(series)
+            obj.parse(verbose=False, engine=engine)
+            obj_arrow = idf.Email(series)
+            obj_arrow.use_arrow_strings()
+            obj_arrow.parse(verbose=False, engine=engine)
+            for column in obj.df.columns:
+                self.assertEqual(obj_arrow.df[column].dtype.storage, 'pyarrow')
+                pd.testing.assert_series_equal(obj.df[column].astype(object), obj_arrow.df[column].astype(object))
+
+        obj = idf.Count(pd.Series([1, 'x', 2.5], dtype=object))
+        obj.use_arrow_strings()
+        self.assertEqual(obj.df[obj.COLUMN_NAME_ORIGINAL].dtype, object)   # not all strings: kept as it is
+
+    def test_zero_copy(self):
+        source = pd.DataFrame({'count': [1.0, 2.0, 3.0], 'fare': [1.5, 'x', 2.5]})
+        dataframe = idf.DataFrame(source)
+        dataframe.register({'count': idf.Count, 'fare': idf.Amount})
+        obj = dataframe['count']
+        self.assertTrue(np.shares_memory(obj.df[obj.COLUMN_NAME_ORIGINAL].to_numpy(), source['count'].to_numpy()))
+
+        df = dataframe.df
+        cached = dataframe._df
+        dataframe.df
+        self.assertIs(dataframe._df, cached)   # cached
+        self.assertEqual(list(df.columns), ['count', 'fare'])
+        df.loc[0, 'count'] = 99.0   # a copy: the cache and the source are unchanged
+        df['other'] = 1
+        self.assertEqual(dataframe.df['count'].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(list(dataframe.df.columns), ['count', 'fare'])
+        self.assertEqual(source['count'].tolist(), [1.0, 2.0, 3.0])
+        obj.parse(verbose=False)
+        dataframe.df
+        self.assertIsNot(dataframe._df, cached)
+        self.assertTrue(np.shares_memory(dataframe.df['count'].to_numpy(), obj.series.to_numpy()))
+        series = obj.series
+        series.iloc[0] = 99   # a copy: the parsed values are unchanged
+        self.assertEqual(obj.df['count'].tolist(), [1, 2, 3])
+        self.assertEqual(dataframe.df['count'].tolist(), [1, 2, 3])
+        pd.testing.assert_series_equal(dataframe.df['fare'], source['fare'], check_names=False)
+
+    def test_series_fns(self):
+        series = pd.Series(['Foo@Bar.com', ' A  B ', 'x@y', np.nan, 'n/a c'])
+        calls = []
+
+        def upper_series(values):
+            calls.append(values.shape[0])
+            return values.str.upper().where(values != 'x', None)   # missing: can't be post-parsed
+
+        for engine in idf.Text.PARSE_ENGINES:
+            obj = idf.Text(series, (('text', StrField()), ('user', StrField(None, upper_series))))
+            obj.add_pre_parse_fn(None, lambda values: values.str.replace(r"\s+", ' ', regex=True))
+            obj.add_match('user@', r"^(?P<user>[^@]*)@.*$", '{user}@')
+            obj.add_match('any', r"^(?P<text>.+)$", '{text}')
+            calls.clear()
+            obj.parse(verbose=False, engine=engine)
+            self.assertEqual(obj.df['user'].tolist(), ['FOO', np.nan, np.nan, np.nan, np.nan])
+            self.assertEqual(obj.df['text'].tolist(), ['FOO@', 'A B', '@', 'nan', 'n/a c'])
+            self.assertEqual(calls[0], 2 if engine == 'vectorized' else 1)
+
+    def test_time_budget(self):
+        series = pd.Series(['aaa', 'a' * 40 + 'b', 'b', 'aa'])
+        for engine in idf.Text.PARSE_ENGINES:
+            for fused in [False, True]:
+                obj = idf.Text(series, (('text', StrField()),))
+                obj.add_match('a+', r"^(?P<text>(a+)+)$", '{text}')   # backtracks catastrophically on 'aa...ab'
+                obj.add_match('b', r"^(?P<text>b)$", '{text}')
+                value_list = obj.parse(verbose=False, engine=engine, fused=fused, time_budget=0.05)
+                self.assertEqual(obj.df['text'].tolist(), ['aaa', np.nan, 'b', 'aa'])
+                self.assertEqual(obj.errors['position'].tolist(), [1])
+                self.assertEqual(obj.errors['error'].tolist(), ['timeout'])
+                self.assertIn('time budget', value_list[0].message)
+        with self.assertRaises(ValueError):
+            idf.Text.from_test_data().parse(verbose=False, time_budget=0)
+
+        series = pd.Series(['aaa', 'b', 'aa'] * 2000 + ['a' * 40 + 'b'] + ['b'] * 10)   # one runaway value
+        obj = idf.Text(series, (('text', StrField()),))
+        obj.add_match('a+', r"^(?P<text>(a+)+)$", '{text}')
+        obj.add_match('b', r"^(?P<text>b)$", '{text}')
+        start = time.perf_counter()
+        obj.parse(verbose=False, engine='vectorized', time_budget=0.002)
+        self.assertLess(time.perf_counter() - start, 3.0)   # the stall is the budget of a block, not of the column (12 s)
+        self.assertEqual(obj.errors['position'].tolist(), [6000])
+        self.assertEqual(obj.df['text'].tolist()[-11:], [np.nan] + ['b'] * 10)
+
+    def test_memo_stats(self):
+        BaseField.PURE_FN_CACHE.clear()
+        series = pd.Series(['250 WEST 27TH STREET', '12 West 27th St', '250 WEST 27TH STREET', '1 BROADWAY'] * 5)
+        for engine in idf.StreetAddressUS.PARSE_ENGINES:
+            obj = idf.StreetAddressUS(series)
+            obj.parse(verbose=False, engine=engine)
+            self.assertEqual(obj.df['street'].tolist()[:4], ['27th Street', '27th Street', '27th Street', 'Broadway'])
+        stats = obj.memo_stats
+        self.assertEqual(stats['misses'], 5)   # 3 distinct streets and 2 directions, shared by both ITypes
+        self.assertEqual(stats['size'], 5)
+        self.assertGreater(stats['hits'], 0)
+
+    def test_numeric_fast_path(self):
+        series_list = [pd.Series([12, 0, -5, 3, 2**40]),
+                       pd.Series([12.0, 7.5, 8.5, -0.0, 0.0, -2.5, np.nan, np.inf, 1e16, 1e-5]),
+                       pd.Series([1.25, -3.5, np.nan], dtype=np.float32)]
+        for series in series_list:
+            for itype, kwargs in [(idf.Balance, {}), (idf.Amount, {}), (idf.Rank, {}), (idf.Count, {}),
+                                  (idf.Count, {'round_float_to_floor': True})]:
+                for engine in itype.PARSE_ENGINES:
+                    parsed = []
+                    for fast in [True, False]:
+                        obj = itype(series, **kwargs)
+                        if fast:   # no string values at all
+                            obj._to_str = obj._to_str_series = None
+                        else:
+                            obj._numeric_regexps = None
+                        value_list = obj.parse(verbose=False, engine=engine, seed=0)
+                        parsed.append((obj.df, obj.errors, obj.hit_counts, [v.messages for v in value_list]))
+                    pd.testing.assert_frame_equal(parsed[0][0], parsed[1][0])
+                    pd.testing.assert_frame_equal(parsed[0][1], parsed[1][1])
+                    self.assertEqual(parsed[0][2:], parsed[1][2:])
+
+        obj = idf.Count(pd.Series([1.5, 2.0]))
+        obj.add_pre_parse_fn(lambda value: value.replace('.5', ''))   # changed IType: parsed by matching
+        obj.parse(verbose=False)
+        self.assertEqual(obj.df['count'].tolist(), [1, 2])
+
+    def test_categorical_column(self):
+        series = pd.Series(['B-', 'A+', 'B-', 'O+', 'A+', 'B-'], index=range(10, 16))
+        parsed = []
+        for kwargs in [{}, {'engine': 'vectorized'}, {'dedupe': True}, {'max_values': 2}]:
+            obj = idf.Label(series)
+            obj.parse(verbose=False, **kwargs)
+            self.assertIsInstance(obj.series.dtype, pd.CategoricalDtype)
+            self.assertEqual(obj.series.astype(object).where(obj.series.notna(), None).tolist(),
+                             series.tolist()[:3] + [None] * 3 if 'max_values' in kwargs else series.tolist())
+            parsed.append(obj.df)
+        pd.testing.assert_frame_equal(parsed[0], parsed[1])
+        pd.testing.assert_frame_equal(parsed[0], parsed[2])
+        self.assertEqual(list(parsed[0]['label'].cat.categories), ['A+', 'B-', 'O+'])
+
+        obj.update(pd.Series(['AB+', 'A+', 'B-'], index=[10, 11, 20]), verbose=False)   # new category
+        self.assertEqual(obj.series.tolist(), ['AB+', 'A+', 'B-'])
+        self.assertEqual(list(obj.series.cat.categories), ['A+', 'AB+', 'B-'])
+
+        chunks = list(idf.Label(series).parse_iter([series.iloc[:2], series.iloc[2:]]))   # categories per chunk
+        column = pd.api.types.union_categoricals([chunk['label'] for chunk in chunks], sort_categories=True)
+        self.assertTrue(pd.Series(column, index=series.index, name='label').equals(parsed[0]['label']))
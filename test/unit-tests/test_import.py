@@ -0,0 +1,37 @@
+import sys
+import unittest
+import subprocess
+
+
+class TestImport(unittest.TestCase):
+
+    def run_python(self, code):
+        return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+
+    def test_lazy_import(self):
+        # parsing doesn't import the plotting and statistics libraries
+        output = self.run_python('import sys\n'
+                                 'import idataframe as idf\n'
+                                 'print(sorted(set(idf.__all__) - set(vars(idf))))\n'
+                                 'idf.Balance.from_test_data().parse(verbose=False)\n'
+                                 'print([name for name in ("plotnine", "scipy") if name in sys.modules])\n')
+        not_imported, heavy_modules = output.strip().split('\n')
+        self.assertIn('StreetAddressUS', not_imported)
+        self.assertEqual(heavy_modules, '[]')
+
+    def test_dataframe_class(self):
+        # importing the submodule `idataframe.DataFrame` first doesn't replace the class by the module
+        output = self.run_python('import idataframe.DataFrame\n'
+                                 'import idataframe as idf\n'
+                                 'print(isinstance(idf.DataFrame, type))\n')
+        self.assertEqual(output.strip(), 'True')
+
+    def test_import_time(self):
+        # importing the package and all ITypes (without its dependencies) stays fast
+        output = self.run_python('import time\n'
+                                 'import numpy, pandas\n'
+                                 'start = time.perf_counter()\n'
+                                 'import idataframe as idf\n'
+                                 'items = [getattr(idf, name) for name in idf.__all__]\n'
+                                 'print(time.perf_counter() - start)\n')
+        self.assertLess(float(output), 0.5)
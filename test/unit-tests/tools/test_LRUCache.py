@@ -0,0 +1,55 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from idataframe.tools import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_memoize(self):
+        calls = []
+
+        def upper(value):
+            calls.append(value)
+            return value.upper()
+
+        cache = LRUCache(max_size=2)
+        memoized = cache.memoize(upper)
+        self.assertEqual([memoized(value) for value in ['a', 'b', 'a', 'c', 'b', 'a']], ['A', 'B', 'A', 'C', 'B', 'A'])
+        self.assertEqual(calls, ['a', 'b', 'c', 'b', 'a'])   # 'b' was the least recently used entry when 'c' was added
+        self.assertEqual(cache.stats, {'hits': 1, 'misses': 5, 'evictions': 3, 'size': 2, 'max_size': 2})
+        self.assertEqual(memoized.__wrapped__, upper)
+
+        self.assertRaises(AttributeError, memoized, None)   # other values than strings aren't cached
+        self.assertEqual(len(cache), 2)
+
+        def override_stats():
+            cache.stats = {}
+        self.assertRaises(PermissionError, override_stats)
+
+        cache.clear()
+        self.assertEqual(cache.stats['hits'], 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_shared(self):
+        class Normalizer(object):
+            def lower(self, value):
+                return value.lower()
+
+        cache = LRUCache()
+        first, second = cache.memoize(Normalizer().lower), cache.memoize(Normalizer().lower)
+        other = cache.memoize(str.upper)
+        self.assertEqual((first('Ab'), second('Ab'), other('Ab')), ('ab', 'ab', 'AB'))
+        self.assertEqual(cache.stats['hits'], 1)   # bound methods of other objects share their results
+        self.assertEqual(len(cache), 2)
+
+    def test_threads(self):
+        cache = LRUCache(max_size=50)
+        memoized = cache.memoize(str.upper)
+        values = [str(i % 200) for i in range(20_000)]
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda start: [memoized(value) for value in values[start::8]], range(8)))
+        self.assertEqual(sorted(sum(results, [])), sorted(value.upper() for value in values))
+        stats = cache.stats
+        self.assertEqual(stats['hits'] + stats['misses'], len(values))
+        self.assertEqual(stats['size'], 50)